@@ -0,0 +1,30 @@
+import logging
+from functools import lru_cache
+from openai import AsyncOpenAI, DefaultAioHttpClient
+from .config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache()
+def get_openai_client() -> AsyncOpenAI:
+    """
+    Shared AsyncOpenAI client (cached), so every call reuses one connection pool.
+    Uses the aiohttp transport, which holds up better than httpx under many
+    concurrent calls; falls back to httpx when the aiohttp extra isn't installed.
+    Callers that need a tighter timeout use `get_openai_client().with_options(timeout=...)`,
+    which returns a lightweight copy backed by the same pool.
+    """
+    try:
+        http_client = DefaultAioHttpClient()
+    except RuntimeError:
+        logger.warning("openai[aiohttp] not installed - using the default httpx transport")
+        http_client = None
+    return AsyncOpenAI(api_key=get_settings().openai_api_key, http_client=http_client)
+
+
+async def close_openai_client() -> None:
+    """Close the shared OpenAI client (called on app shutdown)."""
+    if get_openai_client.cache_info().currsize:
+        await get_openai_client().close()
+        get_openai_client.cache_clear()
@@ -34,6 +34,15 @@ class Settings(BaseSettings):
     tts_similarity_boost: float = Field(default=0.8, env="ELEVEN_TTS_SIMILARITY")
     tts_streaming_latency: int = Field(default=2, env="ELEVEN_TTS_LATENCY")  # 0-4
 
+    # Optional local speech-to-text via faster-whisper (e.g. "small.en").
+    # When unset, transcription uses the OpenAI Whisper API.
+    whisper_local_model: Optional[str] = Field(default=None, env="WHISPER_LOCAL_MODEL")
+    whisper_compute_type: str = Field(default="int8", env="WHISPER_COMPUTE_TYPE")  # "int8" on CPU, "float16" on GPU
+
+    # Per-worker caps on in-flight provider calls, to stay under OpenAI / ElevenLabs rate limits
+    llm_max_concurrency: int = Field(default=16, env="LLM_MAX_CONCURRENCY")
+    tts_max_concurrency: int = Field(default=8, env="TTS_MAX_CONCURRENCY")
+
     # Company report delivery
     company_report_endpoint: Optional[str] = Field(default=None, env="COMPANY_REPORT_ENDPOINT")
 
@@ -1,10 +1,15 @@
 import asyncio
-import json
 import logging
+import random
+import re
+import time
+import orjson
+from functools import lru_cache
 from typing import List, Optional, AsyncIterator
-from openai import AsyncOpenAI
+from .cache import TTLCache
+from .clients import get_openai_client
 from .config import get_settings
-from .schemas import LlmResult, ResumeContext
+from .schemas import LlmResult, ResumeContext, SessionState, Turn
 
 logger = logging.getLogger(__name__)
 
@@ -82,24 +87,70 @@ SYSTEM_PROMPT = (
     "3. You have asked sufficient questions to make a confident evaluation (typically 8-12+ questions) "
     "Otherwise, continue asking follow-up questions or explore new topics from the resume. "
     "The number of questions is not a limiting factor - focus on interview duration and signal quality. "
-    "EVALUATION: When ending, produce ONE evaluation object with EXACT schema: "
-    '{"status": "completed|canceled", '
-    '"resume_summary": "<short 1-2 sentence summary of the resume and interview>", '
-    '"questions": [{"q": "<question text>", "a": "<candidate answer>"}], '
-    '"evaluation": {'
-    '"communication": 1-5, "technical": 1-5, "problem_solving": 1-5, "culture_fit": 1-5, '
-    '"recommendation": "move_forward|hold|reject"'
-    "}}. "
     "Always respond ONLY in JSON with keys: "
     "next_question, answer_score (1-5), rationale, red_flags (list), "
     "question_type (optional: intro|technical|behavioral|followup|clarification), "
-    "end_interview (bool), final_summary (optional 2-4 sentence human-readable summary), "
-    "final_json (optional evaluation object matching the schema above). "
+    "end_interview (bool). "
     "Generate questions that are HIGH-IMPACT and INSIGHTFUL, not generic. "
     "Each question should help meaningfully assess skills, communication, problem-solving, and overall suitability. "
     "Use resume context as a starting point, but prioritize building on candidate responses for deeper evaluation."
 )
 
+# Per-turn grading instructions. These never change, so they lead the user message
+# (after the static system prompt) to keep the request prefix byte-identical
+# across turns for OpenAI's automatic prompt caching; per-turn data goes last.
+TURN_INSTRUCTIONS = (
+    "CRITICAL VALIDATION TASKS (use your intelligence):\n\n"
+    "1. RESPONSE QUALITY: Assess if the answer contains meaningful information relevant to the question. "
+    "   - If non-informative (just 'Thank you', 'OK', etc.), set score=1 and ask for clarification\n"
+    "   - If too brief or lacks substance, set score=1-2 and ask for clarification\n"
+    "   - Only generate follow-up questions if answer contains substantive information\n\n"
+    "2. COMPREHENSIVE RESUME VALIDATION: Cross-check ALL aspects of the answer against resume data:\n"
+    "   - Company/Employer: Compare what candidate says vs. resume (be smart about variations)\n"
+    "   - Skills: Check if candidate mentions skills that match resume (technical vs non-technical, specific technologies)\n"
+    "   - Experience: Verify years of experience, job titles, roles match resume\n"
+    "   - Projects: Check if candidate mentions projects/achievements that align with resume\n"
+    "   - Technologies/Tools: Verify candidate's claims match resume's technical stack\n"
+    "   - Education/Certifications: Check if candidate mentions credentials that match resume\n"
+    "   - Any other claims that should be validated against resume data\n"
+    "   - If ANY inconsistency detected, flag it in red_flags and ask specific clarification question\n\n"
+    "3. CONTEXT AWARENESS: Consider the question asked - is the answer appropriate, complete, and consistent?\n\n"
+    "Generate your response with: "
+    "- answer_score: 1-5 based on answer quality, completeness, and consistency with resume "
+    "- rationale: Explain your assessment, including any quality issues or specific inconsistencies detected "
+    "- red_flags: List any issues found (response quality, specific resume inconsistencies with details) "
+    "- next_question: If answer is insufficient or inconsistent, ask specific clarification. If sufficient, generate intelligent follow-up. "
+    "- question_type: 'clarification' if asking for better answer or resolving inconsistency, otherwise appropriate type "
+    "\n\n"
+)
+
+# Unambiguous consent answers are resolved locally; word boundaries keep "no"
+# from matching "know"/"noon". Hedged answers ("I don't know", "not sure",
+# "wait") and mixed answers ("no problem, let's start") go to the LLM.
+_CONSENT_DENIED_RE = re.compile(r"\b(no|nope|cancel|not now|not ready|later|stop)\b", re.IGNORECASE)
+_CONSENT_HEDGE_RE = re.compile(r"\b(not|wait|maybe)\b|n't\b", re.IGNORECASE)
+_CONSENT_GRANTED_RE = re.compile(
+    r"\b(yes|yeah|yep|yup|sure|ok|okay|ready|go ahead|of course|let'?s (start|begin|go))\b",
+    re.IGNORECASE,
+)
+
+# Only the most recent turns are sent verbatim; older turns are folded into a
+# short locally computed summary so prompt size stays bounded in long interviews.
+HISTORY_WINDOW = 8
+HISTORY_SUMMARY_INTERVAL = 4
+HISTORY_RECENT_MAX_CHARS = 1200  # Verbatim recent turns in the prompt (the summary is never cut)
+HISTORY_SUMMARY_MAX_QUESTIONS = 12  # Earlier question topics listed in the summary
+
+@lru_cache()
+def _llm_semaphore() -> asyncio.Semaphore:
+    """Caps concurrent per-turn LLM calls in this worker (LLM_MAX_CONCURRENCY)."""
+    return asyncio.Semaphore(get_settings().llm_max_concurrency)
+
+
+# Interview length bounds (seconds), shared with the end check in main.py
+MAX_INTERVIEW_DURATION = 20 * 60  # 20 minutes
+MIN_INTERVIEW_DURATION = 15 * 60  # 15 minutes
+
 GREETING_PROMPT = (
     "Generate a friendly, professional greeting introducing yourself as Saj (pronounced as a single name, not spelled out letter by letter) from SA Technologies. "
     "The greeting must include: 'Hi, I am Saj from SA Technologies. I will ask you some questions based on your profile. Shall we start?' "
@@ -109,8 +160,58 @@ GREETING_PROMPT = (
 )
 
 
+def summarize_history(turns: List[Turn]) -> str:
+    """
+    Build a compact summary of older turns without an LLM call.
+    Keeps score/type statistics over all turns and the topics of the last
+    HISTORY_SUMMARY_MAX_QUESTIONS questions (to avoid repeats), so its size is fixed.
+    """
+    if not turns:
+        return ""
+    avg_score = sum(turn.score for turn in turns) / len(turns)
+    type_counts: dict = {}
+    for turn in turns:
+        turn_type = turn.type or "technical"
+        type_counts[turn_type] = type_counts.get(turn_type, 0) + 1
+    types_text = ", ".join(f"{t} x{n}" for t, n in type_counts.items())
+    questions_text = "; ".join(turn.q[:60] for turn in turns[-HISTORY_SUMMARY_MAX_QUESTIONS:])
+    return (
+        f"Earlier turns ({len(turns)}): avg score {avg_score:.1f}; types: {types_text}\n"
+        f"Earlier questions: {questions_text}"
+    )
+
+
+def update_history_summary(state: SessionState) -> None:
+    """
+    Fold turns that left the prompt window into state.history_summary.
+    Runs every HISTORY_SUMMARY_INTERVAL turns once the window is full.
+    """
+    if len(state.history) <= HISTORY_WINDOW or state.question_count % HISTORY_SUMMARY_INTERVAL:
+        return
+    cutoff = len(state.history) - HISTORY_WINDOW
+    state.history_summary = summarize_history(state.history[:cutoff])
+    state.history_summarized_turns = cutoff
+
+
+def _format_turns(turns: List[Turn]) -> str:
+    return "\n".join(
+        f"Q: {turn.q}\nA: {turn.a}\nScore: {turn.score}"
+        for turn in turns
+    )
+
+
+def _history_text(earlier_summary: str, recent_turns: str) -> str:
+    """
+    Prompt history: the rolling summary (fixed size) kept whole, followed by the
+    verbatim recent turns trimmed to their last HISTORY_RECENT_MAX_CHARS characters.
+    """
+    if len(recent_turns) > HISTORY_RECENT_MAX_CHARS:
+        recent_turns = recent_turns[-HISTORY_RECENT_MAX_CHARS:]
+    return f"{earlier_summary}\n{recent_turns}" if earlier_summary else recent_turns
+
+
 async def prepare_llm_context(
-    state: "SessionState",
+    state: SessionState,
     current_question: str,
     role: str,
     level: str,
@@ -141,19 +242,16 @@ async def prepare_llm_context(
         else "None provided"
     )
     
-    # Prepare history summary (can be pre-computed)
-    history_summary = "\n".join(
-        f"Q: {turn['q']}\nA: {turn['a']}\nScore: {turn.get('score','?')}" 
-        for turn in state.history
-    )
+    # Prepare history summary (can be pre-computed): rolling summary + recent turns only
+    recent_turns = _format_turns(state.history[state.history_summarized_turns:])
+    history_summary = _history_text(state.history_summary, recent_turns)
     
     # Calculate signal quality metrics (can be pre-computed)
-    if state.history:
-        avg_score = sum(turn.get('score', 3) for turn in state.history) / len(state.history)
-        high_score_count = sum(1 for turn in state.history if turn.get('score', 3) >= 4)
-        low_score_count = sum(1 for turn in state.history if turn.get('score', 3) <= 2)
-        answer_lengths = [len(turn.get('a', '')) for turn in state.history]
-        avg_answer_length = sum(answer_lengths) / len(answer_lengths) if answer_lengths else 0
+    if state.score_count:
+        avg_score = state.score_sum / state.score_count
+        high_score_count = state.high_score_count
+        low_score_count = state.low_score_count
+        avg_answer_length = state.answer_chars / state.score_count
     else:
         avg_score = 0
         high_score_count = 0
@@ -237,8 +335,16 @@ async def interpret_consent(transcript: str, consent_question: str) -> str:
     Optimized for speed with minimal tokens and fast timeout.
     Returns: "granted", "denied", or "unclear"
     """
-    settings = get_settings()
-    client = AsyncOpenAI(api_key=settings.openai_api_key, timeout=5.0)  # Fast timeout
+    # Fast path: clear yes/no answers need no LLM round-trip
+    denied = _CONSENT_DENIED_RE.search(transcript) is not None
+    granted = _CONSENT_GRANTED_RE.search(transcript) is not None
+    hedged = not denied and _CONSENT_HEDGE_RE.search(transcript) is not None
+    if granted != denied and not hedged:
+        result = "granted" if granted else "denied"
+        logger.info("Consent: %s (keyword match) - '%.30s...'", result.upper(), transcript)
+        return result
+    
+    client = get_openai_client().with_options(timeout=5.0)  # Fast timeout
     
     # Concise prompt for faster processing
     prompt = f"""Question: "{consent_question}"
@@ -260,25 +366,36 @@ Interpret intent: granted/denied/unclear. Reply with one word only."""
         
         # Fast validation
         if "granted" in result or result == "yes":
-            logger.info(f"Consent: GRANTED - '{transcript[:30]}...'")
+            logger.info("Consent: GRANTED - '%.30s...'", transcript)
             return "granted"
         elif "denied" in result or result == "no":
-            logger.info(f"Consent: DENIED - '{transcript[:30]}...'")
+            logger.info("Consent: DENIED - '%.30s...'", transcript)
             return "denied"
         else:
-            logger.info(f"Consent: UNCLEAR - '{transcript[:30]}...'")
+            logger.info("Consent: UNCLEAR - '%.30s...'", transcript)
             return "unclear"
     except Exception as e:
-        logger.error(f"Error interpreting consent: {str(e)}, defaulting to 'unclear'")
+        logger.error("Error interpreting consent: %s, defaulting to 'unclear'", e)
         return "unclear"
 
 
+# Generated greetings per candidate name (lowercased; "" for no name). Once a
+# name has GREETING_POOL_SIZE greetings, one is picked at random instead of
+# calling the LLM, so greetings still vary between sessions.
+_greeting_pool = TTLCache(maxsize=256, ttl=60 * 60)
+GREETING_POOL_SIZE = 5
+
+
 async def generate_greeting(candidate_name: Optional[str] = None) -> str:
     """
     Generate a varied greeting introducing SAJ from SA Technologies.
     """
-    settings = get_settings()
-    client = AsyncOpenAI(api_key=settings.openai_api_key)
+    pool_key = (candidate_name or "").strip().lower()
+    pool = _greeting_pool.get(pool_key) or []
+    if len(pool) >= GREETING_POOL_SIZE:
+        return random.choice(pool)
+    
+    client = get_openai_client()
     
     user_prompt = GREETING_PROMPT
     if candidate_name:
@@ -292,14 +409,63 @@ async def generate_greeting(candidate_name: Optional[str] = None) -> str:
         ],
         temperature=0.7,
     )
-    greeting = resp.choices[0].message.content or "Hi, I am Saj from SA Technologies. I will ask you some questions based on your profile. Shall we start?"
-    return greeting.strip()
+    content = resp.choices[0].message.content
+    if not content:
+        return "Hi, I am Saj from SA Technologies. I will ask you some questions based on your profile. Shall we start?"
+    greeting = content.strip()
+    _greeting_pool.set(pool_key, pool + [greeting])
+    return greeting
+
+
+FINAL_SUMMARY_PROMPT = (
+    "You are summarizing a completed screening interview for the hiring team. "
+    "Write a 2-4 sentence human-readable summary of the candidate's performance covering "
+    "strengths, concerns and the recommendation. Return ONLY the summary text."
+)
+
+
+async def generate_final_summary(state: SessionState, evaluation: dict) -> Optional[str]:
+    """
+    Ask the LLM for a short human-readable summary once the interview has ended.
+    Only called at the end, so per-turn prompts don't carry summary instructions.
+    Returns None on failure so the caller can fall back to a local summary.
+    """
+    client = get_openai_client().with_options(timeout=10.0)
+    scores = evaluation.get("evaluation", {})
+    # Every turn as a compact question/score line, so the whole interview is covered;
+    # only the last HISTORY_WINDOW answers are included verbatim
+    all_questions = "\n".join(
+        f"{i}. [{turn.type or 'technical'}] score {turn.score}: {turn.q[:100]}"
+        for i, turn in enumerate(state.history, 1)
+    )
+    user_content = (
+        f"Candidate: {state.candidate_name or 'Unknown'}\n"
+        f"Role: {state.role}\nLevel: {state.level}\n"
+        f"Scores (1-5): {orjson.dumps(scores).decode()}\n"
+        f"All questions ({len(state.history)}):\n{all_questions}\n"
+        f"Recent answers:\n{_format_turns(state.history[-HISTORY_WINDOW:])}"
+    )
+    try:
+        resp = await client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": FINAL_SUMMARY_PROMPT},
+                {"role": "user", "content": user_content},
+            ],
+            temperature=0.3,
+            max_tokens=200,
+        )
+        summary = (resp.choices[0].message.content or "").strip()
+        return summary or None
+    except Exception as e:
+        logger.error("Final summary generation failed: %s", e)
+        return None
 
 
 async def call_llm(
     role: str,
     level: str,
-    history: List[dict],
+    history: List[Turn],
     transcript: str,
     resume: Optional[ResumeContext],
     has_asked_intro: bool = False,
@@ -310,18 +476,20 @@ async def call_llm(
     prepared_context: Optional[dict] = None,
     current_question: Optional[str] = None,
     elapsed_time: float = 0.0,
+    earlier_summary: str = "",
+    summarized_turns: int = 0,
 ) -> LlmResult:
     """
     Call the LLM to grade the latest answer and generate the next question.
     History is a list of dicts with keys q, a, score.
     
     OPTIMIZATION: If prepared_context is provided, use it to skip redundant computation.
+    Without prepared_context, history is built from earlier_summary (state.history_summary)
+    plus history[summarized_turns:] (state.history_summarized_turns), as prepare_llm_context does.
     """
-    import time
-    start_time = time.time()
+    start_time = time.perf_counter()
     
-    settings = get_settings()
-    client = AsyncOpenAI(api_key=settings.openai_api_key, timeout=15.0)  # Reduced timeout for faster failure
+    client = get_openai_client().with_options(timeout=15.0)  # Reduced timeout for faster failure
     
     # Use prepared context if available, otherwise compute it
     if prepared_context:
@@ -339,7 +507,7 @@ async def call_llm(
         flow_context = f"Intro: {prepared_context['has_asked_intro']}, Behavioral: {prepared_context['has_asked_behavioral']}, Q#{prepared_context['question_count']}, Follow-ups: {prepared_context['followup_count']}"
     else:
         # Fallback to original logic if not prepared
-        history_summary = "\n".join(f"Q: {turn['q']}\nA: {turn['a']}\nScore: {turn.get('score','?')}" for turn in history)
+        history_summary = _history_text(earlier_summary, _format_turns(history[summarized_turns:]))
         resume_text = (
             f"Name: {resume.name or 'Not provided'}\n"
             f"Summary: {resume.summary}\n"
@@ -356,18 +524,17 @@ async def call_llm(
             else "None provided"
         )
         
-        # Calculate signal quality metrics
-        if history:
-            avg_score = sum(turn.get('score', 3) for turn in history) / len(history)
-            high_score_count = sum(1 for turn in history if turn.get('score', 3) >= 4)
-            low_score_count = sum(1 for turn in history if turn.get('score', 3) <= 2)
-            answer_lengths = [len(turn.get('a', '')) for turn in history]
-            avg_answer_length = sum(answer_lengths) / len(answer_lengths) if answer_lengths else 0
-        else:
-            avg_score = 0
-            high_score_count = 0
-            low_score_count = 0
-            avg_answer_length = 0
+        # Calculate signal quality metrics in a single pass (the prepared context
+        # reads these from the session's running aggregates instead)
+        score_sum = high_score_count = low_score_count = answer_chars = 0
+        for turn in history:
+            score = turn.score
+            score_sum += score
+            high_score_count += score >= 4
+            low_score_count += score <= 2
+            answer_chars += len(turn.a)
+        avg_score = score_sum / len(history) if history else 0
+        avg_answer_length = answer_chars / len(history) if history else 0
         
         signal_quality = "strong" if avg_score >= 4 and high_score_count >= 2 else "moderate" if avg_score >= 3 else "weak"
         flow_context = f"Intro: {has_asked_intro}, Behavioral: {has_asked_behavioral}, Q#{question_count}, Follow-ups: {followup_count}"
@@ -383,16 +550,13 @@ async def call_llm(
             followup_instruction = f"\n\nNOTE: {followup_count} follow-ups. After 4, move to new topic."
     
     # OPTIMIZATION: Streamline user content (reduce token count for faster processing)
-    # Truncate resume and history if too long
+    # Truncate resume if too long (history is already bounded by _history_text)
     resume_text_trimmed = resume_text[:800] + "..." if len(resume_text) > 800 else resume_text
-    history_summary_trimmed = history_summary[-1200:] if len(history_summary) > 1200 else history_summary
     
     # Build comprehensive validation instructions
     current_q_context = f"\nQUESTION THAT WAS ASKED: {current_question}\n" if current_question else ""
     
     # Calculate duration context for LLM
-    MAX_INTERVIEW_DURATION = 20 * 60  # 20 minutes
-    MIN_INTERVIEW_DURATION = 15 * 60  # 15 minutes
     remaining_time = max(0, MAX_INTERVIEW_DURATION - elapsed_time)
     time_until_min = max(0, MIN_INTERVIEW_DURATION - elapsed_time)
     
@@ -423,64 +587,46 @@ You have asked {followup_count} questions on the current topic. You MUST now:
 The goal is to create a well-distributed interview across multiple resume topics and dimensions.
 """
     
+    # Stable prefix first (instructions, role, resume), per-turn state last
     user_content = (
-        f"{duration_context}\n"
-        f"{topic_transition_guidance}\n"
+        f"{TURN_INSTRUCTIONS}"
         f"Role: {role}\nLevel: {level}\n"
         f"\n=== RESUME DATA (for validation) ===\n"
         f"{resume_text_trimmed}\n"
         f"=== END RESUME ===\n\n"
+        f"{duration_context}\n"
+        f"{topic_transition_guidance}\n"
         f"Flow status: {flow_context}\n"
-        f"Conversation history:\n{history_summary_trimmed or 'None'}\n"
+        f"Conversation history:\n{history_summary or 'None'}\n"
         f"\n=== CANDIDATE'S LATEST ANSWER ===\n{transcript}\n=== END ANSWER ===\n"
         f"{current_q_context}\n"
-        f"CRITICAL VALIDATION TASKS (use your intelligence):\n\n"
-        f"1. RESPONSE QUALITY: Assess if the answer contains meaningful information relevant to the question. "
-        f"   - If non-informative (just 'Thank you', 'OK', etc.), set score=1 and ask for clarification\n"
-        f"   - If too brief or lacks substance, set score=1-2 and ask for clarification\n"
-        f"   - Only generate follow-up questions if answer contains substantive information\n\n"
-        f"2. COMPREHENSIVE RESUME VALIDATION: Cross-check ALL aspects of the answer against resume data:\n"
-        f"   - Company/Employer: Compare what candidate says vs. resume (be smart about variations)\n"
-        f"   - Skills: Check if candidate mentions skills that match resume (technical vs non-technical, specific technologies)\n"
-        f"   - Experience: Verify years of experience, job titles, roles match resume\n"
-        f"   - Projects: Check if candidate mentions projects/achievements that align with resume\n"
-        f"   - Technologies/Tools: Verify candidate's claims match resume's technical stack\n"
-        f"   - Education/Certifications: Check if candidate mentions credentials that match resume\n"
-        f"   - Any other claims that should be validated against resume data\n"
-        f"   - If ANY inconsistency detected, flag it in red_flags and ask specific clarification question\n\n"
-        f"3. CONTEXT AWARENESS: Consider the question asked - is the answer appropriate, complete, and consistent?\n\n"
-        f"Generate your response with: "
-        f"- answer_score: 1-5 based on answer quality, completeness, and consistency with resume "
-        f"- rationale: Explain your assessment, including any quality issues or specific inconsistencies detected "
-        f"- red_flags: List any issues found (response quality, specific resume inconsistencies with details) "
-        f"- next_question: If answer is insufficient or inconsistent, ask specific clarification. If sufficient, generate intelligent follow-up. "
-        f"- question_type: 'clarification' if asking for better answer or resolving inconsistency, otherwise appropriate type "
-        f"\n{followup_instruction}"
+        f"{followup_instruction}"
         f"\nSignal quality: {signal_quality} (avg: {avg_score:.1f})\n"
         "Return JSON only."
     )
     
-    prep_time = time.time() - start_time
-    logger.info(f"LLM prep time: {prep_time:.2f}s")
+    api_start = time.perf_counter()
+    logger.info("LLM prep time: %.2fs", api_start - start_time)
     
-    api_start = time.time()
-    resp = await client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": user_content},
-        ],
-        temperature=0.4,
-        response_format={"type": "json_object"},
-        max_tokens=300,  # OPTIMIZATION: Limit response size for faster generation
-    )
-    api_time = time.time() - api_start
-    total_time = time.time() - start_time
-    logger.info(f"LLM API call: {api_time:.2f}s, Total LLM time: {total_time:.2f}s")
+    async with _llm_semaphore():
+        resp = await client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": user_content},
+            ],
+            temperature=0.4,
+            response_format={"type": "json_object"},
+            max_tokens=300,  # OPTIMIZATION: Limit response size for faster generation
+        )
+    end_time = time.perf_counter()
+    logger.info("LLM API call: %.2fs, Total LLM time: %.2fs", end_time - api_start, end_time - start_time)
+    if resp.usage and resp.usage.prompt_tokens_details:
+        logger.debug("LLM prompt tokens: %s (%s cached)", resp.usage.prompt_tokens, resp.usage.prompt_tokens_details.cached_tokens or 0)
     raw = resp.choices[0].message.content or "{}"
     try:
-        parsed = json.loads(raw)
-    except json.JSONDecodeError:
+        parsed = orjson.loads(raw)
+    except orjson.JSONDecodeError:
         parsed = {}
     parsed = {
         "next_question": parsed.get("next_question") or "Please share more about your recent work.",
@@ -488,17 +634,15 @@ The goal is to create a well-distributed interview across multiple resume topics
         "rationale": parsed.get("rationale") or "Not provided",
         "red_flags": parsed.get("red_flags") or [],
         "end_interview": bool(parsed.get("end_interview")) if parsed.get("end_interview") is not None else False,
-        "final_summary": parsed.get("final_summary"),
-        "final_json": parsed.get("final_json"),
         "question_type": parsed.get("question_type"),
     }
-    return LlmResult(**parsed)
+    return LlmResult.model_validate(parsed)
 
 
 async def call_llm_streaming(
     role: str,
     level: str,
-    history: List[dict],
+    history: List[Turn],
     transcript: str,
     resume: Optional[ResumeContext],
     has_asked_intro: bool = False,
@@ -508,16 +652,14 @@ async def call_llm_streaming(
     force_new_topic: bool = False,
     prepared_context: Optional[dict] = None,
     current_question: Optional[str] = None,
+    earlier_summary: str = "",
+    summarized_turns: int = 0,
 ) -> AsyncIterator[str]:
     """
     Stream LLM response - yield question text as soon as it's generated,
     before scoring/analysis is complete.
     """
-    import time
-    start_time = time.time()
-    
-    settings = get_settings()
-    client = AsyncOpenAI(api_key=settings.openai_api_key, timeout=15.0)
+    client = get_openai_client().with_options(timeout=15.0)
     
     # Use prepared context if available
     if prepared_context:
@@ -528,7 +670,7 @@ async def call_llm_streaming(
         followup_instruction = prepared_context["followup_instruction"]
         flow_context = f"Intro: {prepared_context['has_asked_intro']}, Behavioral: {prepared_context['has_asked_behavioral']}, Q#{prepared_context['question_count']}, Follow-ups: {prepared_context['followup_count']}"
     else:
-        history_summary = "\n".join(f"Q: {turn['q']}\nA: {turn['a']}\nScore: {turn.get('score','?')}" for turn in history)
+        history_summary = _history_text(earlier_summary, _format_turns(history[summarized_turns:]))
         resume_text = (
             f"Name: {resume.name or 'Not provided'}\n"
             f"Summary: {resume.summary}\n"
@@ -542,14 +684,13 @@ async def call_llm_streaming(
         flow_context = f"Intro: {has_asked_intro}, Behavioral: {has_asked_behavioral}, Q#{question_count}, Follow-ups: {followup_count}"
     
     resume_text_trimmed = resume_text[:800] + "..." if len(resume_text) > 800 else resume_text
-    history_summary_trimmed = history_summary[-1200:] if len(history_summary) > 1200 else history_summary
     current_q_context = f"\nQUESTION THAT WAS ASKED: {current_question}\n" if current_question else ""
     
     user_content = (
         f"Role: {role}\nLevel: {level}\n"
         f"\n=== RESUME DATA ===\n{resume_text_trimmed}\n=== END RESUME ===\n\n"
         f"Flow status: {flow_context}\n"
-        f"Conversation history:\n{history_summary_trimmed or 'None'}\n"
+        f"Conversation history:\n{history_summary or 'None'}\n"
         f"\n=== CANDIDATE'S LATEST ANSWER ===\n{transcript}\n=== END ANSWER ===\n"
         f"{current_q_context}\n"
         f"Generate the next question. Return ONLY the question text, nothing else. "
@@ -647,8 +788,7 @@ async def _generate_single_question_async(
     prepared_context: dict
 ) -> str:
     """Helper to generate a single speculative question quickly."""
-    settings = get_settings()
-    client = AsyncOpenAI(api_key=settings.openai_api_key, timeout=3.0)
+    client = get_openai_client().with_options(timeout=3.0)
     
     try:
         resp = await client.chat.completions.create(
@@ -1,37 +1,141 @@
 import asyncio
+import atexit
 import base64
-import hashlib
-import json
+import binascii
+import itertools
 import logging
 import os
+import queue
+import re
 import time
-import uuid
+from contextlib import aclosing, asynccontextmanager
 from datetime import datetime
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import Iterable, Optional, Pattern, Tuple
 import httpx
-from openai import AsyncOpenAI
+import orjson
 from fastapi import FastAPI, File, HTTPException, UploadFile, WebSocket, WebSocketDisconnect
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from starlette.websockets import WebSocketState
 from .config import get_settings
-from .schemas import AnswerPayload, LlmResult, SessionState, StartPayload
-from .stt import transcribe_base64_audio, transcribe_with_early_reasoning
-from .llm import call_llm, generate_greeting, prepare_llm_context, interpret_consent, generate_speculative_questions, validate_question_relevance
-from .tts import stream_eleven, TTSException
-from .resume import extract_text_from_pdf, summarize_resume
+from .clients import get_openai_client, close_openai_client
+from .middleware import CORSHeadersMiddleware, HealthCheckMiddleware
+from .schemas import AnswerPayload, LlmResult, SessionState, StartPayload, Turn
+from .stt import transcribe_audio
+from .llm import call_llm, generate_greeting, prepare_llm_context, interpret_consent, generate_speculative_questions, validate_question_relevance, update_history_summary, generate_final_summary, MAX_INTERVIEW_DURATION, MIN_INTERVIEW_DURATION
+from .tts import stream_eleven, coalesce, close_client as close_tts_client, precompute_phrase, TTSException
+from .resume import extract_text_from_pdf, summarize_resume, shutdown_executor as shutdown_pdf_executor
 from .schemas import ResumeContext
 
 logger = logging.getLogger(__name__)
 
+# Question repetition detection: Jaccard similarity over character 3-gram shingles.
+# Catches rewordings ("Can you" vs "Could you") while still allowing the same
+# question template to be reused for a different topic.
+REPEAT_SIMILARITY_THRESHOLD = 0.75
 
-app = FastAPI(title="AI Interview Assistant", version="0.1.0")
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+# Red flags that point at a mismatch between the answer and the resume
+_INCONSISTENCY_RE = re.compile(r"resume|inconsistency", re.IGNORECASE)
+
+
+# Diminishing-returns ending: after a grace period, stop once the most recent
+# answers no longer move the score meaningfully relative to the earlier ones.
+ENDING_GRACE_TURNS = 3
+ENDING_MIN_IMPROVEMENT = 0.1  # Relative change in average score
+
+
+def scores_plateaued(state: SessionState) -> bool:
+    """
+    True when the last ENDING_GRACE_TURNS scores improve on the average of the
+    earlier turns by less than ENDING_MIN_IMPROVEMENT (relative). Flat or
+    declining scores count as a plateau; a candidate who is still improving does not.
+    Uses the running score total, so only the recent window is read from history.
+    """
+    if state.score_count <= ENDING_GRACE_TURNS:
+        return False
+    recent_sum = sum(turn.score for turn in state.history[-ENDING_GRACE_TURNS:])
+    recent_avg = recent_sum / ENDING_GRACE_TURNS
+    early_avg = (state.score_sum - recent_sum) / (state.score_count - ENDING_GRACE_TURNS)
+    if early_avg <= 0:
+        return False
+    return (recent_avg - early_avg) / early_avg < ENDING_MIN_IMPROVEMENT
+
+
+def compile_topic_pattern(topics_lower: Iterable[str]) -> Optional[Pattern]:
+    """
+    One regex alternation over lowercased resume topics, matched as whole words.
+    Longer topics are tried first so "java" does not shadow "javascript".
+    Returns None when there is nothing left to match.
+    """
+    alternatives = sorted(topics_lower, key=len, reverse=True)
+    if not alternatives:
+        return None
+    # Lookarounds rather than \b so topics like "c++" or ".net" still match
+    return re.compile(r"(?<!\w)(" + "|".join(map(re.escape, alternatives)) + r")(?!\w)")
+
+
+def question_shingles(text: str) -> frozenset:
+    """Character 3-gram shingles of a lowercased, whitespace-normalised question."""
+    normalized = " ".join(text.lower().split())
+    return frozenset(normalized[i:i + 3] for i in range(len(normalized) - 2))
+
+
+# Shared HTTP client for company report delivery - created at startup so every
+# interview reuses pooled keep-alive connections instead of a fresh TLS handshake
+_report_client: Optional[httpx.AsyncClient] = None
+
+# Fixed first question after consent - its audio is rendered once per worker at startup
+INTRO_QUESTION = "Please introduce yourself in 60 seconds focusing on your most relevant experience for this role."
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _report_client
+    # HTTP/2 is negotiated via ALPN and falls back to HTTP/1.1 if the endpoint lacks it
+    _report_client = httpx.AsyncClient(
+        http2=True,
+        timeout=10.0,
+        limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100),
+    )
+    # Build the shared OpenAI client per worker at startup rather than on the first interview
+    get_openai_client()
+    # Rendered in the background so startup isn't held up by ElevenLabs
+    intro_audio_task = asyncio.create_task(precompute_phrase(INTRO_QUESTION), name="intro_audio")
+    try:
+        yield
+    finally:
+        intro_audio_task.cancel()
+        await _report_client.aclose()
+        _report_client = None
+        await close_tts_client()
+        await close_openai_client()
+        shutdown_pdf_executor()
+
+
+app = FastAPI(
+    title="AI Interview Assistant",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # orjson for all JSON responses
 )
 
+# Settings are fixed for the life of the process - resolve them once
+SETTINGS = get_settings()
+
+# Configure logging
+# Records are queued and written by a background thread, so handlers never
+# block the event loop on stderr I/O
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+_log_listener = QueueListener(_log_queue, _log_stream_handler)
+_log_queue_handler = QueueHandler(_log_queue)
+_log_queue_handler.setFormatter(logging.Formatter("%(message)s"))  # Final formatting happens in the listener
+logging.basicConfig(level=logging.INFO, handlers=[_log_queue_handler])
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Flush queued records on exit
+
 # Configure CORS - must be added before routes
 # Get frontend URL from environment (set this to your Vercel URL in Render)
 FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:5174")
@@ -43,43 +147,46 @@ if FRONTEND_URL == "http://localhost:5174":
     # Local development - restrict to localhost
     allowed_origins = ["http://localhost:5174"]
     allow_credentials = True
-    logger.info(f"Local development - CORS restricted to localhost")
+    logger.info("Local development - CORS restricted to localhost")
 else:
     # Production - allow all origins (frontend on Vercel, backend on Render)
     allowed_origins = ["*"]
     allow_credentials = False  # Must be False when using wildcard
-    logger.info(f"Production mode - allowing all origins (FRONTEND_URL={FRONTEND_URL})")
+    logger.info("Production mode - allowing all origins (FRONTEND_URL=%s)", FRONTEND_URL)
 
 app.add_middleware(
-    CORSMiddleware,
+    CORSHeadersMiddleware,
     allow_origins=allowed_origins,
     allow_credentials=allow_credentials,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["*"],
+)
+# Added last so it is the outermost layer: health probes are answered before
+# CORS handling and routing ever run
+app.add_middleware(
+    HealthCheckMiddleware,
+    body=orjson.dumps({"status": "ok", "voice_id": SETTINGS.eleven_voice_id}),
 )
 
 
 @app.get("/health")
 async def health():
-    settings = get_settings()
-    return JSONResponse({"status": "ok", "voice_id": settings.eleven_voice_id})
+    # Normally answered by HealthCheckMiddleware; kept so the endpoint stays in the OpenAPI schema
+    return ORJSONResponse({"status": "ok", "voice_id": SETTINGS.eleven_voice_id})
 
 
 @app.get("/test-openai")
 async def test_openai():
     """Test OpenAI API connection and response time."""
     try:
-        settings = get_settings()
-        client = AsyncOpenAI(api_key=settings.openai_api_key, timeout=10.0)
+        client = get_openai_client().with_options(timeout=10.0)
         
-        import time
-        start = time.time()
+        start = time.perf_counter()
         resp = await client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[{"role": "user", "content": "Say 'OK'"}],
             max_tokens=10,
         )
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         
         return {
             "status": "success",
@@ -87,8 +194,8 @@ async def test_openai():
             "response_time_seconds": round(elapsed, 2)
         }
     except Exception as e:
-        logger.error(f"OpenAI test failed: {str(e)}", exc_info=True)
-        return JSONResponse(
+        logger.error("OpenAI test failed: %s", e, exc_info=True)
+        return ORJSONResponse(
             {"status": "error", "message": str(e)},
             status_code=500
         )
@@ -100,59 +207,66 @@ async def test_tts():
     Test endpoint to verify ElevenLabs TTS configuration and API connectivity.
     Returns status and any error messages.
     """
-    settings = get_settings()
     result = {
         "status": "unknown",
-        "api_key_configured": bool(settings.eleven_api_key),
-        "voice_id_configured": bool(settings.eleven_voice_id),
-        "voice_id": settings.eleven_voice_id if settings.eleven_voice_id else None,
+        "api_key_configured": bool(SETTINGS.eleven_api_key),
+        "voice_id_configured": bool(SETTINGS.eleven_voice_id),
+        "voice_id": SETTINGS.eleven_voice_id if SETTINGS.eleven_voice_id else None,
         "error": None,
         "chunks_received": 0,
     }
     
     # Check if credentials are configured
-    if not settings.eleven_api_key:
+    if not SETTINGS.eleven_api_key:
         result["status"] = "error"
         result["error"] = "ELEVEN_API_KEY is not configured"
-        return JSONResponse(result, status_code=400)
+        return ORJSONResponse(result, status_code=400)
     
-    if not settings.eleven_voice_id:
+    if not SETTINGS.eleven_voice_id:
         result["status"] = "error"
         result["error"] = "ELEVEN_VOICE_ID is not configured"
-        return JSONResponse(result, status_code=400)
+        return ORJSONResponse(result, status_code=400)
     
     # Test with a short text
     test_text = "Hello, this is a test."
-    logger.info(f"Testing TTS with text: '{test_text}'")
+    logger.info("Testing TTS with text: '%s'", test_text)
     
     try:
         chunk_count = 0
-        async for chunk in stream_eleven(test_text):
-            chunk_count += 1
-            if chunk_count > 10:  # Limit to first 10 chunks for testing
-                break
+        # aclosing() shuts the generator (and its ElevenLabs stream) as soon as we
+        # stop reading, instead of leaving the connection open until GC
+        async with aclosing(stream_eleven(test_text)) as chunks:
+            async for _ in chunks:
+                chunk_count += 1
+                if chunk_count >= 10:  # Limit to first 10 chunks for testing
+                    break
         
         result["status"] = "success"
         result["chunks_received"] = chunk_count
         result["message"] = f"TTS test successful: received {chunk_count} audio chunks"
-        logger.info(f"TTS test successful: {chunk_count} chunks")
-        return JSONResponse(result)
+        logger.info("TTS test successful: %s chunks", chunk_count)
+        return ORJSONResponse(result)
     except TTSException as e:
         result["status"] = "error"
         result["error"] = str(e)
-        logger.error(f"TTS test failed: {str(e)}")
-        return JSONResponse(result, status_code=500)
+        logger.error("TTS test failed: %s", e)
+        return ORJSONResponse(result, status_code=500)
     except Exception as e:
         result["status"] = "error"
         result["error"] = f"Unexpected error: {str(e)}"
-        logger.error(f"TTS test unexpected error: {str(e)}", exc_info=True)
-        return JSONResponse(result, status_code=500)
+        logger.error("TTS test unexpected error: %s", e, exc_info=True)
+        return ORJSONResponse(result, status_code=500)
+
+
+# Log correlation IDs for resume uploads: worker pid + per-process counter,
+# unique across workers without a urandom read per request
+_upload_request_ids = itertools.count()
 
 
 @app.post("/upload-resume")
 async def upload_resume(file: UploadFile = File(...)):
-    request_id = str(uuid.uuid4())[:8]
-    start_time = time.time()
+    request_id = f"{os.getpid() & 0xffff:04x}{next(_upload_request_ids) & 0xffff:04x}"
+    start_time = time.perf_counter()
     
     try:
         # Validate filename
@@ -162,31 +276,28 @@ async def upload_resume(file: UploadFile = File(...)):
         if not file.filename.lower().endswith(".pdf"):
             raise HTTPException(status_code=400, detail="Only PDF resumes are supported.")
         
-        elapsed = time.time() - start_time
-        logger.info(f"[{request_id}] [{elapsed:.2f}s] Received resume upload request: {file.filename}")
+        elapsed = time.perf_counter() - start_time
+        logger.info("[%s] [%.2fs] Received resume upload request: %s", request_id, elapsed, file.filename)
         
         # Read file content with size validation
-        elapsed = time.time() - start_time
-        logger.info(f"[{request_id}] [{elapsed:.2f}s] Reading file content...")
+        elapsed = time.perf_counter() - start_time
+        logger.info("[%s] [%.2fs] Reading file content...", request_id, elapsed)
         
-        # Read in chunks to handle large files and detect size early
         MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB limit
-        content = b""
-        chunk_size = 1024 * 1024  # 1MB chunks
+        too_large_detail = f"File too large. Maximum size is {MAX_FILE_SIZE / (1024*1024):.0f}MB."
         
-        while True:
-            chunk = await file.read(chunk_size)
-            if not chunk:
-                break
-            content += chunk
-            if len(content) > MAX_FILE_SIZE:
-                raise HTTPException(
-                    status_code=400, 
-                    detail=f"File too large. Maximum size is {MAX_FILE_SIZE / (1024*1024):.0f}MB."
-                )
+        # Reject early using the size Starlette recorded while spooling the upload
+        if file.size is not None and file.size > MAX_FILE_SIZE:
+            raise HTTPException(status_code=413, detail=too_large_detail)
+        
+        # The upload is already spooled by Starlette - read it in one call.
+        # Cap the read one byte past the limit in case the size was unknown.
+        content = await file.read(MAX_FILE_SIZE + 1)
+        if len(content) > MAX_FILE_SIZE:
+            raise HTTPException(status_code=413, detail=too_large_detail)
         
-        elapsed = time.time() - start_time
-        logger.info(f"[{request_id}] [{elapsed:.2f}s] File read: {len(content)} bytes ({len(content)/(1024*1024):.2f}MB)")
+        elapsed = time.perf_counter() - start_time
+        logger.info("[%s] [%.2fs] File read: %s bytes (%.2fMB)", request_id, elapsed, len(content), len(content)/(1024*1024))
         
         if not content:
             raise HTTPException(status_code=400, detail="File is empty.")
@@ -195,8 +306,8 @@ async def upload_resume(file: UploadFile = File(...)):
         if not content.startswith(b'%PDF'):
             raise HTTPException(status_code=400, detail="File does not appear to be a valid PDF.")
         
-        elapsed = time.time() - start_time
-        logger.info(f"[{request_id}] [{elapsed:.2f}s] Starting PDF text extraction...")
+        elapsed = time.perf_counter() - start_time
+        logger.info("[%s] [%.2fs] Starting PDF text extraction...", request_id, elapsed)
         
         # Extract text with timeout protection
         try:
@@ -205,21 +316,21 @@ async def upload_resume(file: UploadFile = File(...)):
                 timeout=30.0  # 30 second timeout for PDF extraction
             )
         except asyncio.TimeoutError:
-            elapsed = time.time() - start_time
-            logger.error(f"[{request_id}] [{elapsed:.2f}s] PDF extraction timed out after 30s")
+            elapsed = time.perf_counter() - start_time
+            logger.error("[%s] [%.2fs] PDF extraction timed out after 30s", request_id, elapsed)
             raise HTTPException(
                 status_code=500,
                 detail="PDF processing took too long. Please try with a smaller or simpler PDF file."
             )
         
-        elapsed = time.time() - start_time
-        logger.info(f"[{request_id}] [{elapsed:.2f}s] PDF extraction completed: {len(text)} characters")
+        elapsed = time.perf_counter() - start_time
+        logger.info("[%s] [%.2fs] PDF extraction completed: %s characters", request_id, elapsed, len(text))
         
         if not text.strip():
             raise HTTPException(status_code=400, detail="Could not extract text from PDF. The file may be image-based or corrupted.")
         
-        elapsed = time.time() - start_time
-        logger.info(f"[{request_id}] [{elapsed:.2f}s] Starting OpenAI summarization...")
+        elapsed = time.perf_counter() - start_time
+        logger.info("[%s] [%.2fs] Starting OpenAI summarization...", request_id, elapsed)
         
         # Summarize with timeout protection
         try:
@@ -228,34 +339,34 @@ async def upload_resume(file: UploadFile = File(...)):
                 timeout=70.0  # 70 second timeout for OpenAI API (slightly longer than internal timeout)
             )
         except asyncio.TimeoutError:
-            elapsed = time.time() - start_time
-            logger.error(f"[{request_id}] [{elapsed:.2f}s] OpenAI summarization timed out after 70s")
+            elapsed = time.perf_counter() - start_time
+            logger.error("[%s] [%.2fs] OpenAI summarization timed out after 70s", request_id, elapsed)
             raise HTTPException(
                 status_code=500,
                 detail="Resume analysis took too long. Please try again or contact support."
             )
         except ValueError as ve:
             # Re-raise ValueError from summarize_resume (timeout errors)
-            elapsed = time.time() - start_time
-            logger.error(f"[{request_id}] [{elapsed:.2f}s] OpenAI summarization error: {str(ve)}")
+            elapsed = time.perf_counter() - start_time
+            logger.error("[%s] [%.2fs] OpenAI summarization error: %s", request_id, elapsed, ve)
             raise HTTPException(status_code=500, detail=str(ve))
         
-        elapsed = time.time() - start_time
-        logger.info(f"[{request_id}] [{elapsed:.2f}s] OpenAI summarization completed")
+        elapsed = time.perf_counter() - start_time
+        logger.info("[%s] [%.2fs] OpenAI summarization completed", request_id, elapsed)
         
-        elapsed = time.time() - start_time
-        logger.info(f"[{request_id}] [{elapsed:.2f}s] Resume processing completed successfully (total: {elapsed:.2f}s)")
+        elapsed = time.perf_counter() - start_time
+        logger.info("[%s] [%.2fs] Resume processing completed successfully (total: %.2fs)", request_id, elapsed, elapsed)
         
         return {"resume_context": summary}
         
     except HTTPException:
-        elapsed = time.time() - start_time
-        logger.error(f"[{request_id}] [{elapsed:.2f}s] HTTPException raised")
+        elapsed = time.perf_counter() - start_time
+        logger.error("[%s] [%.2fs] HTTPException raised", request_id, elapsed)
         raise
     except Exception as e:
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         error_msg = str(e)
-        logger.error(f"[{request_id}] [{elapsed:.2f}s] Error processing resume: {error_msg}", exc_info=True)
+        logger.error("[%s] [%.2fs] Error processing resume: %s", request_id, elapsed, error_msg, exc_info=True)
         
         # Provide more user-friendly error messages
         if "timeout" in error_msg.lower() or "timed out" in error_msg.lower():
@@ -275,25 +386,161 @@ async def upload_resume(file: UploadFile = File(...)):
             )
 
 
+# Strong references to fire-and-forget tasks so they are not garbage collected mid-flight
+_background_tasks: set = set()
+
+
+def _on_background_task_done(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Background task %s failed: %s", task.get_name(), task.exception())
+
+
+def run_in_background(coro, name: str) -> asyncio.Task:
+    """Schedule a coroutine without awaiting it; failures are logged."""
+    task = asyncio.create_task(coro, name=name)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_task_done)
+    return task
+
+
+# Static messages sent every turn, serialized once
+_READY_TO_LISTEN = orjson.dumps({"type": "ready_to_listen"}).decode()
+# Receive-loop errors - a misbehaving client can trigger these on every message
+_RECEIVE_ERROR = orjson.dumps({"type": "error", "message": "Error receiving answer"}).decode()
+_EXPECTED_ANSWER_ERROR = orjson.dumps({"type": "error", "message": "expected answer message"}).decode()
+
+
+# Upper bound on one TTS utterance before the candidate is told to answer anyway
+TTS_TIMEOUT_SECONDS = 30.0
+
+
+async def _stream_speech(ws: WebSocket, text: str, tag: str, timeout: float, text_sent: asyncio.Event) -> None:
+    """
+    Stream TTS audio for `text` to the client, then send ready_to_listen.
+    The ElevenLabs request starts immediately, but nothing is written to the
+    socket until `text_sent` is set, so question_text always arrives first.
+    ready_to_listen follows whether TTS completes, fails or times out.
+    """
+    logger.info("Starting TTS for %s: %s characters", tag, len(text))
+    chunk_count = 0
+    try:
+        # Bound the whole stream so the candidate is never left waiting on stalled audio
+        async with asyncio.timeout(timeout):
+            # aclosing: a failed send or timeout releases the TTS stream immediately
+            async with aclosing(coalesce(stream_eleven(text))) as audio:
+                async for chunk in audio:
+                    if not chunk_count:
+                        await text_sent.wait()
+                    await ws.send_bytes(chunk)
+                    chunk_count += 1
+        logger.info("TTS streaming completed for %s: %s chunks sent", tag, chunk_count)
+    except TimeoutError:
+        logger.warning("TTS for %s took longer than %.0fs (%s chunks sent), sending ready_to_listen", tag, timeout, chunk_count)
+    except TTSException as e:
+        logger.error("TTS failed for %s: %s", tag, e)
+        await text_sent.wait()
+        await send_json(ws, {"type": "tts_error", "message": f"Audio generation failed: {str(e)}"})
+    except Exception as e:
+        logger.error("Unexpected error in %s TTS streaming: %s", tag, e, exc_info=True)
+        await text_sent.wait()
+        await send_json(ws, {"type": "tts_error", "message": f"Audio generation failed: {str(e)}"})
+    await text_sent.wait()
+    await ws.send_text(_READY_TO_LISTEN)
+
+
+def speak(
+    ws: WebSocket,
+    text: str,
+    tag: str,
+    timeout: float = TTS_TIMEOUT_SECONDS,
+    text_sent: Optional[asyncio.Event] = None,
+) -> asyncio.Task:
+    """
+    Speak `text` in a background task.
+    If `text_sent` is given, audio is held back until it is set; otherwise the
+    caller must already have sent question_text.
+    The text is passed by value, so reassigning the caller's current_question
+    can't change what is being spoken.
+    """
+    if text_sent is None:
+        text_sent = asyncio.Event()
+        text_sent.set()
+    return run_in_background(_stream_speech(ws, text, tag, timeout, text_sent), name=f"tts_{tag}")
+
+
+async def send_question(ws: WebSocket, text: str, tag: str) -> asyncio.Task:
+    """
+    Send question_text and speak it, starting the TTS request before the text
+    send so ElevenLabs' time-to-first-byte overlaps with it.
+    If the text can't be sent, the speech task is cancelled and the error re-raised.
+    """
+    text_sent = asyncio.Event()
+    tts_task = speak(ws, text, tag, text_sent=text_sent)
+    try:
+        await send_json(ws, {"type": "question_text", "text": text})
+    except BaseException:
+        tts_task.cancel()
+        raise
+    text_sent.set()
+    return tts_task
+
+
+def unpack_answer_frame(data: bytes) -> Tuple[dict, bytes]:
+    """
+    Split a binary answer frame into its JSON header and raw audio bytes.
+    Layout: [4-byte big-endian header length][JSON header][audio bytes].
+    Raises ValueError for truncated frames or malformed headers.
+    """
+    if len(data) < 4:
+        raise ValueError(f"answer frame too short ({len(data)} bytes)")
+    header_len = int.from_bytes(data[:4], "big")
+    if 4 + header_len > len(data):
+        raise ValueError(f"answer frame header length {header_len} exceeds frame size {len(data)}")
+    header = orjson.loads(data[4:4 + header_len])
+    if not isinstance(header, dict):
+        raise ValueError("answer frame header must be a JSON object")
+    if not isinstance(header.get("mime_type") or "", str):
+        raise ValueError("answer frame mime_type must be a string")
+    return header, data[4 + header_len:]
+
+
+async def send_json(ws: WebSocket, message: dict) -> None:
+    """
+    Serialize a message with orjson and send it as a text frame.
+    Text frames carry JSON messages; binary frames are reserved for audio.
+    """
+    await ws.send_text(orjson.dumps(message).decode())
+
+
+async def send_batch(ws: WebSocket, messages: list) -> None:
+    """
+    Send several JSON messages as one text frame: {"type": "batch", "messages": [...]}.
+    The client dispatches the inner messages in order.
+    """
+    await send_json(ws, {"type": "batch", "messages": messages})
+
+
 @app.websocket("/ws/interview")
 async def interview(ws: WebSocket):
     await ws.accept()
-    settings = get_settings()
     state: Optional[SessionState] = None
     current_question: Optional[str] = None
+    # Speech for the latest question - streams while we wait for the answer
+    tts_task: Optional[asyncio.Task] = None
     try:
         # Expect a start payload first
-        start_msg = await ws.receive_json()
+        start_msg = orjson.loads(await ws.receive_text())
         if start_msg.get("type") != "start":
-            await ws.send_json({"type": "error", "message": "expected start message"})
+            await send_json(ws, {"type": "error", "message": "expected start message"})
             await ws.close()
             return
 
-        start_payload = StartPayload(**start_msg["data"])
+        start_payload = StartPayload.model_validate(start_msg["data"])
         
         # Require resume context
         if not start_payload.resume_context:
-            await ws.send_json({"type": "error", "message": "Resume is required to start interview"})
+            await send_json(ws, {"type": "error", "message": "Resume is required to start interview"})
             await ws.close()
             return
         
@@ -307,8 +554,15 @@ async def interview(ws: WebSocket):
             resume_context=start_payload.resume_context,
             history=[],
             interview_started_at=datetime.now().isoformat(),
-            interview_start_time=time.time(),  # Track interview start time for duration limits
+            interview_start_time=time.monotonic(),  # Track interview start time for duration limits
+            resume_summary=start_payload.resume_context.summary,
         )
+        resume_ctx = state.resume_context
+        projects = set(resume_ctx.projects)
+        for topic in resume_ctx.skills + resume_ctx.projects + resume_ctx.roles + resume_ctx.tools:
+            if topic:
+                state.uncovered_topics.setdefault(topic.lower(), (topic, topic in projects))
+        state.topic_pattern = compile_topic_pattern(state.uncovered_topics)
         
         # Display resume summary
         resume_summary_text = ""
@@ -318,96 +572,69 @@ async def interview(ws: WebSocket):
             top_skills = ", ".join(state.resume_context.skills[:3])
             resume_summary_text = f"I see you have experience with {top_skills}."
         if resume_summary_text:
-            await ws.send_json({"type": "resume_summary", "text": resume_summary_text})
+            await send_json(ws, {"type": "resume_summary", "text": resume_summary_text})
         
         # Generate varied greeting
         greeting = await generate_greeting(candidate_name)
         current_question = greeting
-        # Send question text immediately (frontend will display when audio starts)
-        await ws.send_json({"type": "question_text", "text": current_question})
-        
-        # Stream TTS audio in background - text already sent, so user sees it while audio generates
-        async def stream_greeting_tts():
-            try:
-                logger.info(f"Starting TTS for greeting: {len(current_question)} characters")
-                chunk_count = 0
-                async for chunk in stream_eleven(current_question):
-                    await ws.send_bytes(chunk)
-                    chunk_count += 1
-                logger.info(f"TTS streaming completed: {chunk_count} chunks sent")
-                await ws.send_json({"type": "ready_to_listen"})
-            except TTSException as e:
-                logger.error(f"TTS failed for greeting: {str(e)}")
-                await ws.send_json({"type": "tts_error", "message": f"Audio generation failed: {str(e)}"})
-                await ws.send_json({"type": "ready_to_listen"})
-            except Exception as e:
-                logger.error(f"Unexpected error in greeting TTS streaming: {str(e)}", exc_info=True)
-                # Ensure ready_to_listen is always sent, even on unexpected errors
-                await ws.send_json({"type": "tts_error", "message": f"Audio generation failed: {str(e)}"})
-                await ws.send_json({"type": "ready_to_listen"})
-        
-        # Start TTS streaming as background task with error callback
-        greeting_tts_task = asyncio.create_task(stream_greeting_tts())
-        
-        def greeting_tts_callback(task):
-            try:
-                if task.exception():
-                    logger.error(f"Greeting TTS task failed with exception: {task.exception()}", exc_info=True)
-                else:
-                    logger.info(f"Greeting TTS task completed successfully")
-            except Exception as e:
-                logger.error(f"Error in greeting TTS task callback: {str(e)}", exc_info=True)
-        
-        greeting_tts_task.add_done_callback(greeting_tts_callback)
-        
-        # Add safety timeout for greeting TTS
-        async def greeting_safety_timeout():
-            await asyncio.sleep(30)
-            if not greeting_tts_task.done():
-                logger.warning("Greeting TTS task taking too long (>30s), sending ready_to_listen as safety measure")
-                try:
-                    await ws.send_json({"type": "ready_to_listen"})
-                except Exception as e:
-                    logger.error(f"Error sending safety ready_to_listen for greeting: {str(e)}")
-        
-        asyncio.create_task(greeting_safety_timeout())
+        # Send question text and stream TTS audio in background (frontend will display when audio starts)
+        tts_task = await send_question(ws, current_question, "greeting")
 
         # Main turn loop
         while True:
             try:
-                logger.info("Waiting for answer from candidate...")
+                logger.debug("Waiting for answer from candidate...")
                 # Remove timeout - wait indefinitely for candidate's answer
                 # The frontend VAD will handle when to send the answer based on actual speech
-                msg = await ws.receive_json()
-                logger.info(f"Received message type: {msg.get('type')}")
+                frame = await ws.receive()
+                if frame["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(frame.get("code", 1000))
+                if frame.get("bytes") is not None:
+                    # Binary answer frame: raw audio, no base64
+                    msg, audio_bytes = unpack_answer_frame(frame["bytes"])
+                else:
+                    msg, audio_bytes = orjson.loads(frame["text"]), None
+                logger.debug("Received message type: %s", msg.get('type'))
             except WebSocketDisconnect:
                 logger.info("WebSocket disconnected by client")
                 return
+            except ValueError as e:
+                # Malformed frame (bad JSON, truncated or invalid header) - client error, no traceback
+                logger.warning("Rejected malformed message: %s", e)
+                await ws.send_text(_RECEIVE_ERROR)
+                continue
             except Exception as e:
-                logger.error(f"Error receiving message: {str(e)}", exc_info=True)
-                await ws.send_json({"type": "error", "message": "Error receiving answer"})
+                logger.error("Error receiving message: %s", e, exc_info=True)
+                await ws.send_text(_RECEIVE_ERROR)
                 continue
                 
             if msg.get("type") != "answer":
-                await ws.send_json({"type": "error", "message": "expected answer message"})
+                await ws.send_text(_EXPECTED_ANSWER_ERROR)
                 continue
 
-            payload = AnswerPayload(**msg["data"])
+            if audio_bytes is None:
+                # JSON answer frame with base64 audio - decode here once; transcription works on the raw bytes
+                payload = AnswerPayload.model_validate(msg["data"])
+                mime_type = payload.mime_type
+                try:
+                    audio_bytes = base64.b64decode(payload.audio_base64)
+                except binascii.Error as e:
+                    logger.warning("Invalid base64 audio payload: %s", e)
+                    audio_bytes = b""
+            else:
+                mime_type = msg.get("mime_type") or "audio/wav"
             
-            # Log audio details for debugging
-            audio_bytes = base64.b64decode(payload.audio_base64)
-            logger.info(f"=== RECEIVED AUDIO ===")
-            logger.info(f"Audio size: {len(audio_bytes)} bytes")
-            logger.info(f"MIME type: {payload.mime_type}")
-            logger.info(f"Current question: '{current_question[:100] if current_question else 'None'}...'")
-            logger.info(f"Audio hash (first 100 bytes): {hashlib.md5(audio_bytes[:100]).hexdigest()}")
-            logger.info(f"Timestamp: {datetime.now().isoformat()}")
-            logger.info(f"=========================")
+            # Log audio details for debugging (skipped entirely unless DEBUG is enabled)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Received audio: %d bytes, mime=%s, question='%.100s...'",
+                    len(audio_bytes), mime_type, current_question or "None",
+                )
             
             # PHASE 1-4: Low-latency architecture - incremental transcription with early reasoning
-            turn_start_time = time.time()
+            turn_start_time = time.monotonic()  # Monotonic clock for per-turn deltas
             
-            # Prepare LLM context in parallel (non-blocking)
+            # Transcription and LLM context prep are independent - run them concurrently
             llm_prep_task = asyncio.create_task(
                 prepare_llm_context(
                     state=state,
@@ -421,40 +648,29 @@ async def interview(ws: WebSocket):
                     force_new_topic=state.followup_count >= 4,
                 )
             )
-            
-            # PHASE 1: Incremental transcription with early reasoning
-            # This starts reasoning as soon as we have partial transcript
-            prepared_context = await llm_prep_task  # Wait for context prep (fast)
-            prep_time = time.time() - turn_start_time
-            logger.info(f"LLM context prepared in {prep_time:.2f}s")
-            
-            # SIMPLIFIED: Single transcription call - faster and more accurate
-            # Removed incremental approach and early reasoning that was adding latency
-            try:
-                transcript, _ = await transcribe_with_early_reasoning(
-                    payload.audio_base64,
-                    payload.mime_type,
-                    current_question,
-                    state,
-                    prepared_context,
-                    call_llm
+            transcribe_task = asyncio.create_task(
+                transcribe_audio(
+                    audio_bytes,
+                    mime_type,
+                    current_question=current_question,
                 )
-            except Exception as e:
-                logger.error(f"Transcription failed: {str(e)}", exc_info=True)
-                # Fallback to direct transcription
-                try:
-                    transcript = await transcribe_base64_audio(
-                        payload.audio_base64,
-                        payload.mime_type,
-                        current_question=current_question
-                    )
-                except Exception as fallback_error:
-                    logger.error(f"Fallback transcription also failed: {str(fallback_error)}")
-                    transcript = None
+            )
+            prepared_context, transcript = await asyncio.gather(
+                llm_prep_task, transcribe_task, return_exceptions=True
+            )
+            if isinstance(prepared_context, BaseException):
+                # call_llm rebuilds the context itself when none is prepared
+                logger.error("LLM context preparation failed: %s", prepared_context)
+                prepared_context = None
+            if isinstance(transcript, BaseException):
+                logger.error("Transcription failed: %s", transcript)
+                transcript = None
+            # Downstream code treats an empty transcript as an unclear answer
+            transcript = transcript or ""
             
             # Stricter validation: handle empty or very short transcripts defensively
             if not transcript or not transcript.strip() or len(transcript.strip()) < 3:
-                logger.warning(f"Received empty or very short transcript: '{transcript}' - treating as unclear answer")
+                logger.warning("Received empty or very short transcript: '%s' - treating as unclear answer", transcript)
                 # Don't reject completely - treat as low-quality answer and let LLM handle it
                 # But ensure we don't get stuck in a loop
                 if state.clarification_depth >= 2:
@@ -468,30 +684,27 @@ async def interview(ws: WebSocket):
                 # Don't send ready_to_listen here - let normal flow handle it
             
             # Log the actual transcript for debugging - this should always be the real Whisper result
-            transcription_time = time.time() - turn_start_time
-            logger.info(f"=== TRANSCRIPT RECEIVED ===")
-            logger.info(f"Full transcript: '{transcript}'")
-            logger.info(f"Transcript length: {len(transcript)} characters")
-            logger.info(f"Transcription completed in {transcription_time:.2f}s")
-            logger.info(f"Current question: '{current_question[:100] if current_question else 'None'}...'")
-            logger.info(f"===========================")
+            transcription_time = time.monotonic() - turn_start_time
+            logger.info("Transcript received: %s characters in %.2fs", len(transcript), transcription_time)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Full transcript: '%s' (question: '%.100s...')", transcript, current_question)
 
             # Check for consent interpretation (first answer only) - AI-based, optimized for speed
             if len(state.history) == 0 and not state.consent_given:
-                logger.info(f"Consent answer received: '{transcript}'")
+                logger.debug("Consent answer received: '%s'", transcript)
                 
                 # Use AI to intelligently interpret consent intent (optimized for speed)
-                consent_start_time = time.time()
+                consent_start_time = time.monotonic()
                 consent_result = await interpret_consent(transcript, current_question)
-                consent_time = time.time() - consent_start_time
-                logger.info(f"Consent interpretation completed in {consent_time:.2f}s: {consent_result}")
+                consent_time = time.monotonic() - consent_start_time
+                logger.info("Consent interpretation completed in %.2fs: %s", consent_time, consent_result)
                 
                 if consent_result == "denied":
                     # Candidate declined - cancel interview
                     logger.info("Candidate declined consent - canceling interview")
                     canceled_eval = {
                         "status": "canceled",
-                        "resume_summary": state.resume_context.summary if state.resume_context else None,
+                        "resume_summary": state.resume_summary,
                         "questions": [{"q": current_question, "a": transcript}],
                         "evaluation": {
                             "communication": 0,
@@ -501,9 +714,11 @@ async def interview(ws: WebSocket):
                             "recommendation": "reject"
                         }
                     }
-                    await ws.send_json({"type": "json_report", "data": canceled_eval})
-                    await send_report_to_company(state, canceled_eval)
-                    await ws.send_json({"type": "done", "message": "Interview canceled. Thank you."})
+                    await send_batch(ws, [
+                        {"type": "json_report", "data": canceled_eval},
+                        {"type": "done", "message": "Interview canceled. Thank you."},
+                    ])
+                    run_in_background(send_report_to_company(state, canceled_eval), name="company_report")
                     await ws.close()
                     return
                 elif consent_result == "unclear":
@@ -511,52 +726,8 @@ async def interview(ws: WebSocket):
                     logger.info("Consent response unclear - asking for clarification")
                     clarification = "I didn't quite catch that. Are you ready to begin the interview? Please say 'yes' to start or 'no' to cancel."
                     current_question = clarification
-                    # Send question text immediately
-                    await ws.send_json({"type": "question_text", "text": current_question})
-                    
-                    # Stream TTS for clarification in background (non-blocking)
-                    async def stream_clarification_tts():
-                        try:
-                            logger.info(f"Starting TTS for clarification: {len(current_question)} characters")
-                            chunk_count = 0
-                            async for chunk in stream_eleven(current_question):
-                                await ws.send_bytes(chunk)
-                                chunk_count += 1
-                            logger.info(f"TTS streaming completed: {chunk_count} chunks sent")
-                            await ws.send_json({"type": "ready_to_listen"})
-                        except TTSException as e:
-                            logger.error(f"TTS failed for clarification: {str(e)}")
-                            await ws.send_json({"type": "tts_error", "message": f"Audio generation failed: {str(e)}"})
-                            await ws.send_json({"type": "ready_to_listen"})
-                        except Exception as e:
-                            logger.error(f"Unexpected error in clarification TTS streaming: {str(e)}", exc_info=True)
-                            await ws.send_json({"type": "tts_error", "message": f"Audio generation failed: {str(e)}"})
-                            await ws.send_json({"type": "ready_to_listen"})
-                    
-                    clarification_tts_task = asyncio.create_task(stream_clarification_tts())
-                    
-                    def clarification_tts_callback(task):
-                        try:
-                            if task.exception():
-                                logger.error(f"Clarification TTS task failed with exception: {task.exception()}", exc_info=True)
-                            else:
-                                logger.info(f"Clarification TTS task completed successfully")
-                        except Exception as e:
-                            logger.error(f"Error in clarification TTS task callback: {str(e)}", exc_info=True)
-                    
-                    clarification_tts_task.add_done_callback(clarification_tts_callback)
-                    
-                    # Add safety timeout for clarification TTS
-                    async def clarification_safety_timeout():
-                        await asyncio.sleep(30)
-                        if not clarification_tts_task.done():
-                            logger.warning("Clarification TTS task taking too long (>30s), sending ready_to_listen as safety measure")
-                            try:
-                                await ws.send_json({"type": "ready_to_listen"})
-                            except Exception as e:
-                                logger.error(f"Error sending safety ready_to_listen for clarification: {str(e)}")
-                    
-                    asyncio.create_task(clarification_safety_timeout())
+                    # Send question text and stream TTS for clarification in background (non-blocking)
+                    tts_task = await send_question(ws, current_question, "clarification")
                     
                     # Continue to next iteration to wait for clarification response
                     continue
@@ -565,7 +736,7 @@ async def interview(ws: WebSocket):
                     logger.info("Consent granted - proceeding with interview")
                     state.consent_given = True
                     # Send the consent answer transcript to frontend for display
-                    await ws.send_json({
+                    await send_json(ws, {
                         "type": "turn_result",
                         "transcript": transcript,  # Show what candidate actually said
                         "score": 0,  # No score for consent
@@ -576,66 +747,23 @@ async def interview(ws: WebSocket):
                     
                     # Don't call LLM for consent answer - proceed directly to intro question
                     # Set the intro question directly
-                    current_question = "Please introduce yourself in 60 seconds focusing on your most relevant experience for this role."
-                    # Send question text immediately (frontend will display when audio starts)
-                    await ws.send_json({"type": "question_text", "text": current_question})
-                    
-                    # Stream TTS for intro question in background (non-blocking)
-                    async def stream_intro_tts():
-                        try:
-                            logger.info(f"Starting TTS for intro question: {len(current_question)} characters")
-                            chunk_count = 0
-                            async for chunk in stream_eleven(current_question):
-                                await ws.send_bytes(chunk)
-                                chunk_count += 1
-                            logger.info(f"TTS streaming completed: {chunk_count} chunks sent")
-                            await ws.send_json({"type": "ready_to_listen"})
-                        except TTSException as e:
-                            logger.error(f"TTS failed for intro question: {str(e)}")
-                            await ws.send_json({"type": "tts_error", "message": f"Audio generation failed: {str(e)}"})
-                            await ws.send_json({"type": "ready_to_listen"})
-                        except Exception as e:
-                            logger.error(f"Unexpected error in intro TTS streaming: {str(e)}", exc_info=True)
-                            await ws.send_json({"type": "tts_error", "message": f"Audio generation failed: {str(e)}"})
-                            await ws.send_json({"type": "ready_to_listen"})
-                    
-                    # Start TTS streaming as background task with error callback
-                    intro_tts_task = asyncio.create_task(stream_intro_tts())
-                    
-                    def intro_tts_callback(task):
-                        try:
-                            if task.exception():
-                                logger.error(f"Intro TTS task failed with exception: {task.exception()}", exc_info=True)
-                            else:
-                                logger.info(f"Intro TTS task completed successfully")
-                        except Exception as e:
-                            logger.error(f"Error in intro TTS task callback: {str(e)}", exc_info=True)
-                    
-                    intro_tts_task.add_done_callback(intro_tts_callback)
-                    
-                    # Add safety timeout for intro TTS
-                    async def intro_safety_timeout():
-                        await asyncio.sleep(30)
-                        if not intro_tts_task.done():
-                            logger.warning("Intro TTS task taking too long (>30s), sending ready_to_listen as safety measure")
-                            try:
-                                await ws.send_json({"type": "ready_to_listen"})
-                            except Exception as e:
-                                logger.error(f"Error sending safety ready_to_listen for intro: {str(e)}")
-                    
-                    asyncio.create_task(intro_safety_timeout())
+                    current_question = INTRO_QUESTION
+                    state.has_asked_intro = True
+                    # Send question text and stream TTS for intro question in background (non-blocking)
+                    tts_task = await send_question(ws, current_question, "intro question")
                     
                     # Continue to next iteration to wait for intro answer
                 continue
 
             # Call LLM with full transcript - with proper error handling
             force_new_topic = state.followup_count >= 4
-            llm_start_time = time.time()
+            llm_start_time = time.monotonic()
             
             # Calculate elapsed time before calling LLM
-            elapsed_time = time.time() - (state.interview_start_time or time.time())
+            elapsed_time = time.monotonic() - (state.interview_start_time or time.monotonic())
             
-            logger.info(f"Calling LLM: question_count={state.question_count}, has_asked_intro={state.has_asked_intro}, has_asked_behavioral={state.has_asked_behavioral}, followup_count={state.followup_count}, force_new_topic={force_new_topic}, elapsed_time={elapsed_time:.1f}s ({elapsed_time/60:.1f}min), transcript='{transcript[:50] if transcript else 'None'}...'")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Calling LLM: question_count=%s, has_asked_intro=%s, has_asked_behavioral=%s, followup_count=%s, force_new_topic=%s, elapsed_time=%.1fs (%.1fmin), transcript='%.50s...'", state.question_count, state.has_asked_intro, state.has_asked_behavioral, state.followup_count, force_new_topic, elapsed_time, elapsed_time/60, transcript or 'None')
             
             try:
                 llm_result: LlmResult = await call_llm(
@@ -652,11 +780,13 @@ async def interview(ws: WebSocket):
                     prepared_context=prepared_context,
                     current_question=current_question,
                     elapsed_time=elapsed_time,
+                    earlier_summary=state.history_summary,
+                    summarized_turns=state.history_summarized_turns,
                 )
-                llm_time = time.time() - llm_start_time
-                logger.info(f"LLM call completed in {llm_time:.2f}s")
+                llm_time = time.monotonic() - llm_start_time
+                logger.info("LLM call completed in %.2fs", llm_time)
             except Exception as e:
-                logger.error(f"LLM call failed: {str(e)}", exc_info=True)
+                logger.error("LLM call failed: %s", e, exc_info=True)
                 # Fallback to safe default question to prevent interview from getting stuck
                 llm_result = LlmResult(
                     next_question="Can you tell me more about that?",
@@ -666,16 +796,16 @@ async def interview(ws: WebSocket):
                     end_interview=False,
                     question_type="technical"
                 )
-                logger.warning(f"Using fallback question due to LLM error: '{llm_result.next_question}'")
+                logger.warning("Using fallback question due to LLM error: '%s'", llm_result.next_question)
             
             # Log if LLM detected any issues
             if llm_result.answer_score <= 1:
-                logger.warning(f"LLM detected low-quality response (score={llm_result.answer_score}): {llm_result.rationale}")
-            if any("resume" in flag.lower() or "inconsistency" in flag.lower() for flag in llm_result.red_flags):
-                logger.warning(f"LLM detected resume inconsistency: {llm_result.red_flags}")
-                logger.info(f"LLM generated clarification: '{llm_result.next_question}'")
+                logger.warning("LLM detected low-quality response (score=%s): %s", llm_result.answer_score, llm_result.rationale)
+            if any(_INCONSISTENCY_RE.search(flag) for flag in llm_result.red_flags):
+                logger.warning("LLM detected resume inconsistency: %s", llm_result.red_flags)
+                logger.info("LLM generated clarification: '%s'", llm_result.next_question)
             
-            logger.info(f"LLM response: answer_score={llm_result.answer_score}, question_type={llm_result.question_type}, end_interview={llm_result.end_interview}, red_flags={llm_result.red_flags}")
+            logger.info("LLM response: answer_score=%s, question_type=%s, end_interview=%s, red_flags=%s", llm_result.answer_score, llm_result.question_type, llm_result.end_interview, llm_result.red_flags)
 
             # Track question types and follow-ups with clarification depth management
             if llm_result.question_type == "intro":
@@ -694,12 +824,12 @@ async def interview(ws: WebSocket):
                 # Check if we're following up on the same topic
                 if state.current_topic:
                     state.followup_count += 1
-                    logger.info(f"Follow-up question #{state.followup_count} on topic: {state.current_topic[:50]}...")
+                    logger.info("Follow-up question #%s on topic: %.50s...", state.followup_count, state.current_topic)
                 else:
                     # First follow-up, set the topic based on current question
                     state.current_topic = current_question[:50]  # Use first 50 chars as topic identifier
                     state.followup_count = 1
-                    logger.info(f"Starting follow-up sequence on topic: {state.current_topic}")
+                    logger.info("Starting follow-up sequence on topic: %s", state.current_topic)
                 
                 # Track clarification depth for unclear/low-quality answers
                 # Use a more robust topic identifier that captures resume mismatch patterns
@@ -710,15 +840,15 @@ async def interview(ws: WebSocket):
                     
                     if state.last_clarification_topic == topic_key:
                         state.clarification_depth += 1
-                        logger.info(f"Clarification depth increased to {state.clarification_depth} for topic: {topic_key[:50]}...")
+                        logger.info("Clarification depth increased to %s for topic: %.50s...", state.clarification_depth, topic_key)
                     else:
                         state.clarification_depth = 1
                         state.last_clarification_topic = topic_key
-                        logger.info(f"Starting clarification tracking for topic: {topic_key[:50]}...")
+                        logger.info("Starting clarification tracking for topic: %.50s...", topic_key)
                     
                     # MAX CLARIFICATION DEPTH: After 2 clarifications, move on
                     if state.clarification_depth >= 2:
-                        logger.warning(f"Reached max clarification depth ({state.clarification_depth}) for topic: {topic_key[:50]}...")
+                        logger.warning("Reached max clarification depth (%s) for topic: %.50s...", state.clarification_depth, topic_key)
                         logger.info("Moving to new question from resume to avoid clarification loop")
                         # Force new topic
                         state.current_topic = None
@@ -740,7 +870,7 @@ async def interview(ws: WebSocket):
 
             # Check if we've exceeded follow-up limit (4 consecutive follow-ups)
             if state.followup_count >= 4:
-                logger.info(f"Reached follow-up limit ({state.followup_count}) on topic. Forcing new question from resume.")
+                logger.info("Reached follow-up limit (%s) on topic. Forcing new question from resume.", state.followup_count)
                 # Reset tracking - will force new topic in next LLM call
                 state.current_topic = None
                 state.followup_count = 0
@@ -759,23 +889,22 @@ async def interview(ws: WebSocket):
                         "communication": False
                     }
                 
-                # Extract topics mentioned in the question or answer
-                question_lower = llm_result.next_question.lower()
-                transcript_lower = transcript.lower() if transcript else ""
-                
-                # Check which resume topics were discussed
-                all_resume_topics = (
-                    state.resume_context.skills +
-                    state.resume_context.projects +
-                    state.resume_context.roles +
-                    state.resume_context.tools
-                )
-                
-                for topic in all_resume_topics:
-                    if topic and (topic.lower() in question_lower or topic.lower() in transcript_lower):
-                        if topic not in state.covered_topics:
-                            state.covered_topics.append(topic)
-                            logger.info(f"New topic covered: {topic}")
+                # Check which not-yet-covered resume topics were discussed, noting project
+                # mentions in the same pass. Covered topics drop out of uncovered_topics
+                # (and the pattern), so matching stops entirely once all are covered.
+                project_mentioned = False
+                if state.topic_pattern is not None:
+                    # Question and answer are scanned as one haystack
+                    # (newline-separated so no topic matches across them)
+                    haystack = f"{llm_result.next_question}\n{transcript or ''}".lower()
+                    matched = dict.fromkeys(state.topic_pattern.findall(haystack))
+                    for topic_lower in matched:
+                        topic, is_project = state.uncovered_topics.pop(topic_lower)
+                        project_mentioned = project_mentioned or is_project
+                        state.covered_topics.append(topic)
+                        logger.info("New topic covered: %s", topic)
+                    if matched:
+                        state.topic_pattern = compile_topic_pattern(state.uncovered_topics)
                 
                 # Track dimension coverage based on question type
                 if llm_result.question_type == "technical":
@@ -786,8 +915,7 @@ async def interview(ws: WebSocket):
                 state.covered_dimensions["communication"] = True
                 
                 # Check if projects/impact were discussed
-                if any(proj.lower() in question_lower or proj.lower() in transcript_lower 
-                       for proj in state.resume_context.projects if proj):
+                if project_mentioned:
                     state.covered_dimensions["projects"] = True
                     state.covered_dimensions["impact"] = True
 
@@ -798,15 +926,30 @@ async def interview(ws: WebSocket):
                 state.struggle_streak = 0
 
             state.question_count += 1
-            state.history.append({
-                "q": current_question, 
-                "a": transcript, 
-                "score": llm_result.answer_score,
-                "type": llm_result.question_type or "technical"
-            })
+            turn_score = llm_result.answer_score
+            turn_type = llm_result.question_type or "technical"
+            state.history.append(Turn(
+                q=current_question,
+                a=transcript,
+                score=turn_score,
+                type=turn_type,
+                q_shingles=question_shingles(current_question),
+            ))
+            state.asked_questions.add(" ".join(current_question.lower().split()))
+            # Keep running aggregates in step with history
+            state.score_sum += turn_score
+            state.score_count += 1
+            if turn_score >= 4:
+                state.high_score_count += 1
+            elif turn_score <= 2:
+                state.low_score_count += 1
+            state.answer_chars += len(transcript)
+            state.type_score_sum[turn_type] = state.type_score_sum.get(turn_type, 0) + turn_score
+            state.type_count[turn_type] = state.type_count.get(turn_type, 0) + 1
+            update_history_summary(state)
             
             # Send turn_result with actual transcript from Whisper (never hardcoded)
-            await ws.send_json(
+            await send_json(ws,
                 {
                     "type": "turn_result",
                     "transcript": transcript,  # This is always the actual Whisper transcript
@@ -819,24 +962,15 @@ async def interview(ws: WebSocket):
 
             # Check if interview should end
             # Dynamic ending based on signal quality and LLM decision
-            # Calculate signal quality metrics
-            if state.history:
-                avg_score = sum(turn.get('score', 3) for turn in state.history) / len(state.history)
-                high_score_count = sum(1 for turn in state.history if turn.get('score', 3) >= 4)
-                low_score_count = sum(1 for turn in state.history if turn.get('score', 3) <= 2)
-                has_strong_signals = avg_score >= 3.5 and high_score_count >= 2 and len(state.history) >= 4
-                has_weak_signals = avg_score <= 2.5 and low_score_count >= 3 and len(state.history) >= 5
-            else:
-                avg_score = 0
-                has_strong_signals = False
-                has_weak_signals = False
+            avg_score = state.score_sum / state.score_count if state.score_count else 0
+            # Further questions are unlikely to change the outcome once scores plateau
+            has_plateaued = scores_plateaued(state)
+            has_weak_signals = avg_score <= 2.5 and state.low_score_count >= 3 and state.score_count >= 5
             
             # Dynamic ending conditions - PURELY TIME-BASED (15-20 minutes)
             # Remove all question count limits - let time and quality determine ending
-            MAX_INTERVIEW_DURATION = 20 * 60  # 20 minutes in seconds
-            MIN_INTERVIEW_DURATION = 15 * 60  # 15 minutes in seconds
             
-            elapsed_time = time.time() - (state.interview_start_time or time.time())
+            elapsed_time = time.monotonic() - (state.interview_start_time or time.monotonic())
             
             # CRITICAL: Ignore LLM's end_interview decision if we haven't reached minimum duration
             # The LLM may want to end early, but we enforce the 15-minute minimum
@@ -847,44 +981,45 @@ async def interview(ws: WebSocket):
             should_end = (
                 # 1. LLM wants to end AND minimum duration reached AND we have at least 1 question
                 can_end_based_on_llm or
-                # 2. Strong signals collected AND minimum duration reached (regardless of question count)
-                (has_strong_signals and state.has_asked_intro and state.has_asked_behavioral and elapsed_time >= MIN_INTERVIEW_DURATION) or
+                # 2. Scores have plateaued (diminishing returns) AND minimum duration reached
+                (has_plateaued and state.has_asked_intro and state.has_asked_behavioral and elapsed_time >= MIN_INTERVIEW_DURATION) or
                 # 3. Weak signals but minimum duration reached (candidate struggling, move on)
                 (has_weak_signals and elapsed_time >= MIN_INTERVIEW_DURATION) or
                 # 4. Hard time limit reached (20 minutes) - must end
                 elapsed_time >= MAX_INTERVIEW_DURATION
             )
             
-            # Log detailed end check information
-            logger.info(f"Interview end check: should_end={should_end}, question_count={state.question_count}, "
-                        f"end_interview={llm_result.end_interview}, llm_wants_to_end={llm_wants_to_end}, "
-                        f"can_end_based_on_llm={can_end_based_on_llm}, has_asked_intro={state.has_asked_intro}, "
-                        f"has_asked_behavioral={state.has_asked_behavioral}, avg_score={avg_score:.1f}, "
-                        f"has_strong_signals={has_strong_signals}, has_weak_signals={has_weak_signals}, "
-                        f"elapsed_time={elapsed_time:.1f}s ({elapsed_time/60:.1f}min), "
-                        f"MIN_DURATION={MIN_INTERVIEW_DURATION/60:.1f}min, MAX_DURATION={MAX_INTERVIEW_DURATION/60:.1f}min")
+            # Log detailed end check information (skip building the arguments when INFO is off)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Interview end check: should_end=%s, question_count=%s, "
+                            "end_interview=%s, llm_wants_to_end=%s, "
+                            "can_end_based_on_llm=%s, has_asked_intro=%s, "
+                            "has_asked_behavioral=%s, avg_score=%.1f, "
+                            "has_plateaued=%s, has_weak_signals=%s, "
+                            "elapsed_time=%.1fs (%.1fmin), "
+                            "MIN_DURATION=%.1fmin, MAX_DURATION=%.1fmin",
+                            should_end, state.question_count, llm_result.end_interview, llm_wants_to_end, can_end_based_on_llm, state.has_asked_intro, state.has_asked_behavioral, avg_score, has_plateaued, has_weak_signals, elapsed_time, elapsed_time/60, MIN_INTERVIEW_DURATION/60, MAX_INTERVIEW_DURATION/60)
             
             if should_end:
-                # Generate final evaluation if not provided by LLM
-                if llm_result.final_json:
-                    final_eval = llm_result.final_json
-                else:
-                    # Generate evaluation from history
-                    final_eval = generate_final_evaluation(state, llm_result)
+                # Scores come from the running aggregates; only the prose summary needs the LLM
+                final_eval = generate_final_evaluation(state, llm_result)
                 
-                if llm_result.final_summary:
-                    await ws.send_json({"type": "summary", "text": llm_result.final_summary})
-                else:
-                    # Generate summary if not provided
-                    summary = generate_human_summary(state, final_eval)
-                    await ws.send_json({"type": "summary", "text": summary})
+                # Report and done go out immediately, so the UI does not wait on
+                # the summary LLM call; the summary follows as its own frame
+                await send_batch(ws, [
+                    {"type": "json_report", "data": final_eval},
+                    {"type": "done", "message": "Interview complete. Thank you!"},
+                ])
                 
-                await ws.send_json({"type": "json_report", "data": final_eval})
+                # Deliver the company report in the background - closing the
+                # session should not wait on an external endpoint
+                run_in_background(send_report_to_company(state, final_eval), name="company_report")
                 
-                # Send report to company endpoint if configured
-                await send_report_to_company(state, final_eval)
+                summary = await generate_final_summary(state, final_eval)
+                if not summary:
+                    summary = generate_human_summary(state, final_eval)
+                await send_json(ws, {"type": "summary", "text": summary})
                 
-                await ws.send_json({"type": "done", "message": "Interview complete. Thank you!"})
                 await ws.close()
                 return
 
@@ -899,48 +1034,43 @@ async def interview(ws: WebSocket):
                 
                 # Additional validation: ensure question is meaningful (at least 10 characters)
                 if len(current_question.strip()) < 10:
-                    logger.warning(f"Generated question too short: '{current_question}' - using fallback")
+                    logger.warning("Generated question too short: '%s' - using fallback", current_question)
                     current_question = "Can you tell me more about your experience with this technology?"
                 
                 # Prevent question repetition
                 if state.history:
-                    previous_questions = [turn["q"].lower().strip() for turn in state.history]
-                    current_question_lower = current_question.lower().strip()
-                    
-                    # Check for exact matches or very similar questions (80% similarity threshold)
-                    is_repeat = False
-                    for prev_q in previous_questions:
-                        if current_question_lower == prev_q:
-                            is_repeat = True
-                            break
-                        # Check for high similarity (simple word overlap check)
-                        current_words = set(current_question_lower.split())
-                        prev_words = set(prev_q.split())
-                        if len(current_words) > 0 and len(prev_words) > 0:
-                            overlap = len(current_words & prev_words) / max(len(current_words), len(prev_words))
-                            if overlap > 0.8:  # 80% word overlap indicates repetition
+                    # Exact repeats are a set lookup; only otherwise compare shingles
+                    is_repeat = " ".join(current_question.lower().split()) in state.asked_questions
+                    current_shingles = question_shingles(current_question)
+                    if not is_repeat and current_shingles:
+                        for turn in state.history:
+                            prev_shingles = turn.q_shingles
+                            if not prev_shingles:
+                                continue
+                            similarity = len(current_shingles & prev_shingles) / len(current_shingles | prev_shingles)
+                            if similarity >= REPEAT_SIMILARITY_THRESHOLD:
                                 is_repeat = True
                                 break
                     
                     if is_repeat:
-                        logger.warning(f"LLM attempted to repeat question: '{current_question}'. Generating alternative follow-up.")
+                        logger.warning("LLM attempted to repeat question: '%s'. Generating alternative follow-up.", current_question)
                         # Generate a fallback follow-up based on the latest answer
-                        latest_answer = state.history[-1]["a"] if state.history else transcript
-                        # Extract key phrases and create a specific follow-up
-                        answer_words = latest_answer.split()[:20]  # First 20 words
-                        key_phrase = " ".join(answer_words[-5:]) if len(answer_words) >= 5 else latest_answer[:50]
+                        latest_answer = state.history[-1].a if state.history else transcript
+                        # Use the last few words of the answer as the key phrase (single rsplit pass)
+                        tail = latest_answer.rsplit(None, 5)[-5:]
+                        key_phrase = " ".join(tail) if tail else latest_answer[:50]
                         current_question = f"Can you tell me more about {key_phrase}? Specifically, what challenges did you face and how did you overcome them?"
-                        logger.info(f"Generated alternative follow-up: '{current_question}'")
+                        logger.info("Generated alternative follow-up: '%s'", current_question)
                 
             except Exception as question_error:
-                logger.error(f"CRITICAL ERROR in question generation: {str(question_error)}", exc_info=True)
+                logger.error("CRITICAL ERROR in question generation: %s", question_error, exc_info=True)
                 # Always set a fallback question - never skip
                 current_question = "Can you tell me more about your experience?"
-                logger.warning(f"Using fallback question due to error: '{current_question}'")
+                logger.warning("Using fallback question due to error: '%s'", current_question)
                 
                 # Try to send error notification (non-blocking)
                 try:
-                    await ws.send_json({
+                    await send_json(ws, {
                         "type": "error", 
                         "message": "Error generating next question. Using fallback question."
                     })
@@ -952,37 +1082,38 @@ async def interview(ws: WebSocket):
             
             # Send question text IMMEDIATELY (frontend will display when audio starts)
             # This reduces perceived latency - user sees question while TTS generates
-            logger.info(f"=== SENDING NEXT QUESTION ===")
-            logger.info(f"Question: '{current_question[:100]}{'...' if len(current_question) > 100 else ''}'")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sending next question: '%.100s%s'", current_question, '...' if len(current_question) > 100 else '')
             
             # CRITICAL: Ensure question_text is sent with retry logic
             question_sent = False
             max_retries = 3
             for attempt in range(max_retries):
                 try:
-                    await ws.send_json({"type": "question_text", "text": current_question})
-                    logger.info("question_text sent successfully")
+                    # Starts the TTS request too; audio follows once the text is out
+                    tts_task = await send_question(ws, current_question, "question")
+                    logger.debug("question_text sent successfully")
                     question_sent = True
                     break
                 except Exception as e:
-                    logger.error(f"Attempt {attempt + 1}/{max_retries} to send question_text failed: {str(e)}", exc_info=True)
+                    logger.error("Attempt %s/%s to send question_text failed: %s", attempt + 1, max_retries, e, exc_info=True)
                     if attempt < max_retries - 1:
                         await asyncio.sleep(0.1)  # Brief delay before retry
                     else:
                         # Last attempt failed - but we MUST send a question
-                        logger.error(f"CRITICAL: Failed to send question_text after {max_retries} attempts")
+                        logger.error("CRITICAL: Failed to send question_text after %s attempts", max_retries)
                         # Try one more time with a simple fallback question
                         try:
                             fallback_question = "Can you tell me more about your experience?"
-                            await ws.send_json({"type": "question_text", "text": fallback_question})
-                            logger.warning(f"Sent fallback question after retry failures: '{fallback_question}'")
+                            tts_task = await send_question(ws, fallback_question, "question")
+                            logger.warning("Sent fallback question after retry failures: '%s'", fallback_question)
                             question_sent = True
                             current_question = fallback_question
                         except Exception as final_error:
-                            logger.error(f"CRITICAL: Even fallback question send failed: {str(final_error)}", exc_info=True)
+                            logger.error("CRITICAL: Even fallback question send failed: %s", final_error, exc_info=True)
                             # Last resort: send error and close connection
                             try:
-                                await ws.send_json({
+                                await send_json(ws, {
                                     "type": "error", 
                                     "message": "Unable to send next question. Please refresh and try again."
                                 })
@@ -991,79 +1122,22 @@ async def interview(ws: WebSocket):
                             # Don't continue - this is a critical failure
                             return  # Exit the interview loop
             
-            # Only proceed with TTS if question_text was sent successfully
+            # send_question() cancels its TTS task when the text can't be sent
             if not question_sent:
                 logger.error("Skipping TTS - question_text was not sent successfully")
                 continue
-            
-            # Stream TTS audio in background task - runs in parallel
-            # Text already sent, so user sees it while audio generates
-            async def stream_question_tts():
-                try:
-                    logger.info(f"Starting TTS for question: {len(current_question)} characters")
-                    chunk_count = 0
-                    async for chunk in stream_eleven(current_question):
-                        await ws.send_bytes(chunk)
-                        chunk_count += 1
-                    logger.info(f"TTS streaming completed: {chunk_count} chunks sent")
-                    await ws.send_json({"type": "ready_to_listen"})
-                except TTSException as e:
-                    logger.error(f"TTS failed for question: {str(e)}")
-                    await ws.send_json({"type": "tts_error", "message": f"Audio generation failed: {str(e)}"})
-                    await ws.send_json({"type": "ready_to_listen"})
-                except Exception as e:
-                    logger.error(f"Unexpected error in TTS streaming: {str(e)}", exc_info=True)
-                    # Ensure ready_to_listen is always sent, even on unexpected errors
-                    await ws.send_json({"type": "tts_error", "message": f"Audio generation failed: {str(e)}"})
-                    await ws.send_json({"type": "ready_to_listen"})
-            
-            # Start TTS streaming as background task - non-blocking
-            # Store the task to ensure it completes and doesn't fail silently
-            question_tts_task = asyncio.create_task(stream_question_tts())
-            
-            def tts_task_callback(task):
-                try:
-                    if task.exception():
-                        logger.error(f"Question TTS task failed with exception: {task.exception()}", exc_info=True)
-                        # Ensure ready_to_listen is sent even if TTS task fails
-                        # Use asyncio to send it from the callback context
-                        async def send_ready_on_error():
-                            try:
-                                await ws.send_json({"type": "ready_to_listen"})
-                            except Exception as send_error:
-                                logger.error(f"Failed to send ready_to_listen after TTS error: {str(send_error)}")
-                        asyncio.create_task(send_ready_on_error())
-                    else:
-                        logger.info(f"Question TTS task completed successfully")
-                except Exception as e:
-                    logger.error(f"Error in TTS task callback: {str(e)}", exc_info=True)
-                    # Safety: try to send ready_to_listen even if callback itself fails
-                    async def send_ready_safety():
-                        try:
-                            await ws.send_json({"type": "ready_to_listen"})
-                        except Exception:
-                            pass  # Ignore errors in safety net
-                    asyncio.create_task(send_ready_safety())
-            
-            question_tts_task.add_done_callback(tts_task_callback)
-            
-            # Add a safety timeout: if TTS doesn't complete in 30 seconds, send ready_to_listen anyway
-            async def safety_timeout():
-                await asyncio.sleep(30)
-                if not question_tts_task.done():
-                    logger.warning("TTS task taking too long (>30s), sending ready_to_listen as safety measure")
-                    try:
-                        await ws.send_json({"type": "ready_to_listen"})
-                    except Exception as e:
-                        logger.error(f"Error sending safety ready_to_listen: {str(e)}")
-            
-            asyncio.create_task(safety_timeout())
 
     except WebSocketDisconnect:
         return
     except Exception as exc:
-        await ws.send_json({"type": "error", "message": str(exc)})
-        await asyncio.sleep(0)
+        await send_json(ws, {"type": "error", "message": str(exc)})
+    finally:
+        # Stop streaming audio (and free the ElevenLabs slot) if the client left mid-question
+        if tts_task is not None:
+            tts_task.cancel()
+        # Close from our side unless the session already closed the socket
+        if ws.application_state == WebSocketState.CONNECTED and ws.client_state == WebSocketState.CONNECTED:
+            await ws.close()
 
 
 def generate_final_evaluation(state: SessionState, last_llm_result: LlmResult) -> dict:
@@ -1083,39 +1157,29 @@ def generate_final_evaluation(state: SessionState, last_llm_result: LlmResult) -
     }
     """
     questions = [
-        {"q": turn["q"], "a": turn["a"]}
+        {"q": turn.q, "a": turn.a}
         for turn in state.history
     ]
 
-    # Aggregate scores from history
-    if state.history:
-        scores = [turn.get("score", 3) for turn in state.history]
-        avg_score = sum(scores) / len(scores)
+    # Aggregate scores from the running per-type totals
+    if state.score_count:
+        avg_score = state.score_sum / state.score_count
         communication_score = last_llm_result.answer_score
         
+        def type_average(*types: str) -> float:
+            count = sum(state.type_count.get(t, 0) for t in types)
+            if not count:
+                return avg_score
+            return sum(state.type_score_sum.get(t, 0) for t in types) / count
+        
         # Calculate technical score from technical questions
-        technical_turns = [t for t in state.history if t.get("type") in ["technical", "followup"]]
-        technical_score = (
-            sum(t.get("score", 3) for t in technical_turns) / len(technical_turns)
-            if technical_turns
-            else avg_score
-        )
+        technical_score = type_average("technical", "followup")
         
         # Problem solving from behavioral and follow-up questions
-        problem_turns = [t for t in state.history if t.get("type") in ["behavioral", "followup"]]
-        problem_score = (
-            sum(t.get("score", 3) for t in problem_turns) / len(problem_turns)
-            if problem_turns
-            else avg_score
-        )
+        problem_score = type_average("behavioral", "followup")
         
         # Culture fit from behavioral questions
-        behavioral_turns = [t for t in state.history if t.get("type") == "behavioral"]
-        culture_score = (
-            sum(t.get("score", 3) for t in behavioral_turns) / len(behavioral_turns)
-            if behavioral_turns
-            else avg_score
-        )
+        culture_score = type_average("behavioral")
     else:
         avg_score = 3
         communication_score = 3
@@ -1130,7 +1194,7 @@ def generate_final_evaluation(state: SessionState, last_llm_result: LlmResult) -
         else "reject"
     )
 
-    resume_summary = state.resume_context.summary if state.resume_context and state.resume_context.summary else None
+    resume_summary = state.resume_summary or None
 
     return {
         "status": "completed",
@@ -1146,29 +1210,42 @@ def generate_final_evaluation(state: SessionState, last_llm_result: LlmResult) -
     }
 
 
+# Lookup tables for generate_human_summary
+_SCORE_KEYS = ("communication", "technical", "problem_solving", "culture_fit")
+_STRENGTH_TABLE = (
+    ("technical", "strong technical skills"),
+    ("communication", "clear communication"),
+    ("problem_solving", "good problem-solving"),
+)
+# Every strengths phrase, indexed by a bitmask (bit i set = _STRENGTH_TABLE[i] scored >= 4)
+_STRENGTH_TEXTS = tuple(
+    ", ".join(label for i, (_, label) in enumerate(_STRENGTH_TABLE) if mask >> i & 1) or "adequate skills"
+    for mask in range(1 << len(_STRENGTH_TABLE))
+)
+_REC_TEXT = {
+    "move_forward": "Recommend moving to technical interview",
+    "hold": "Recommend holding for further review",
+    "reject": "Recommend rejection",
+}
+
+
 def generate_human_summary(state: SessionState, evaluation: dict) -> str:
     """Generate a human-readable summary."""
     candidate_name = state.candidate_name or "The candidate"
     role = state.role
     eval_scores = evaluation.get("evaluation", {})
-    avg_score = sum(eval_scores.values()) / len(eval_scores) if eval_scores else 3
+    # Average the numeric dimensions only - "recommendation" is a string
+    scores = [eval_scores[key] for key in _SCORE_KEYS if key in eval_scores]
+    avg_score = sum(scores) / len(scores) if scores else 3
     
     recommendation = eval_scores.get("recommendation", "hold")
-    rec_text = {
-        "move_forward": "Recommend moving to technical interview",
-        "hold": "Recommend holding for further review",
-        "reject": "Recommend rejection"
-    }.get(recommendation, "Recommend further review")
+    rec_text = _REC_TEXT.get(recommendation, "Recommend further review")
     
-    strengths = []
-    if eval_scores.get("technical", 0) >= 4:
-        strengths.append("strong technical skills")
-    if eval_scores.get("communication", 0) >= 4:
-        strengths.append("clear communication")
-    if eval_scores.get("problem_solving", 0) >= 4:
-        strengths.append("good problem-solving")
-    
-    strengths_text = ", ".join(strengths) if strengths else "adequate skills"
+    mask = 0
+    for i, (key, _) in enumerate(_STRENGTH_TABLE):
+        if eval_scores.get(key, 0) >= 4:
+            mask |= 1 << i
+    strengths_text = _STRENGTH_TEXTS[mask]
     
     return (
         f"{candidate_name} demonstrates {strengths_text} for the {role} position. "
@@ -1182,35 +1259,32 @@ async def send_report_to_company(state: SessionState, evaluation: dict) -> None:
     Send the final evaluation report to the configured company endpoint.
     Handles errors gracefully without failing the interview.
     """
-    settings = get_settings()
-    if not settings.company_report_endpoint:
+    if not SETTINGS.company_report_endpoint:
         return
     
     try:
         interview_duration = None
-        if state.interview_started_at:
-            start_time = datetime.fromisoformat(state.interview_started_at)
-            end_time = datetime.now()
-            interview_duration = int((end_time - start_time).total_seconds())
+        if state.interview_start_time:
+            interview_duration = int(time.monotonic() - state.interview_start_time)
         
         report_payload = {
             "candidate_name": state.candidate_name or "Unknown",
             "interview_date": state.interview_started_at or datetime.now().isoformat(),
             "duration_seconds": interview_duration or 0,
             "evaluation": evaluation,
-            "resume_summary": state.resume_context.summary if state.resume_context else None,
+            "resume_summary": state.resume_summary,
         }
         
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                settings.company_report_endpoint,
-                json=report_payload,
-                headers={"Content-Type": "application/json"},
-            )
-            response.raise_for_status()
-    except Exception as e:
+        if _report_client is not None:
+            response = await _report_client.post(SETTINGS.company_report_endpoint, json=report_payload)
+        else:
+            # Outside the app lifespan (e.g. scripts) fall back to a one-off client
+            async with httpx.AsyncClient(timeout=10.0) as client:
+                response = await client.post(SETTINGS.company_report_endpoint, json=report_payload)
+        response.raise_for_status()
+    except Exception:
         # Log error but don't fail the interview
-        print(f"Failed to send report to company endpoint: {e}")
+        logger.exception("Failed to send report to company endpoint")
 
 
 
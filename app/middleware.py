@@ -0,0 +1,110 @@
+from typing import Iterable, List, Tuple
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+Headers = List[Tuple[bytes, bytes]]
+
+
+class CORSHeadersMiddleware:
+    """
+    Minimal pure-ASGI CORS handling for a static origin allowlist (or "*").
+    Answers preflight requests directly and appends the CORS headers to the
+    `http.response.start` message, without building Request/Response objects.
+    WebSocket and lifespan scopes pass straight through.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Iterable[str],
+        allow_credentials: bool = False,
+        allow_methods: Iterable[str] = ("GET", "POST", "PUT", "DELETE", "OPTIONS"),
+        max_age: int = 600,
+    ):
+        self.app = app
+        origins = list(allow_origins)
+        self.allow_all = "*" in origins
+        self.allow_origins = frozenset(o.encode("latin-1") for o in origins)
+        self.allow_credentials = allow_credentials
+        # "*" is only valid for the origin header when credentials are not allowed
+        self.echo_origin = not self.allow_all or allow_credentials
+
+        self.simple_headers: Headers = []
+        if allow_credentials:
+            self.simple_headers.append((b"access-control-allow-credentials", b"true"))
+        self.preflight_headers: Headers = self.simple_headers + [
+            (b"access-control-allow-methods", ", ".join(allow_methods).encode("latin-1")),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+        ]
+
+    def _origin_headers(self, origin: bytes) -> Headers:
+        if self.echo_origin:
+            return [(b"access-control-allow-origin", origin), (b"vary", b"Origin")]
+        return [(b"access-control-allow-origin", b"*")]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        # Same-origin / non-browser requests, or origins we don't serve
+        if origin is None or not (self.allow_all or origin in self.allow_origins):
+            await self.app(scope, receive, send)
+            return
+
+        origin_headers = self._origin_headers(origin)
+
+        # Preflight: answer here without dispatching to the app
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            headers = origin_headers + self.preflight_headers
+            if request_headers is not None:
+                # All request headers are allowed - echo back what was asked for
+                headers.append((b"access-control-allow-headers", request_headers))
+            headers.append((b"content-length", b"0"))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        extra_headers = origin_headers + self.simple_headers
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + extra_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
+class HealthCheckMiddleware:
+    """
+    Answers `GET /health` with a pre-serialized body before routing.
+    Load balancer probes hit this path constantly; serving it here skips
+    router dispatch and response construction entirely.
+    """
+
+    def __init__(self, app: ASGIApp, body: bytes, path: str = "/health"):
+        self.app = app
+        self.path = path
+        self.body = body
+        self.headers: Headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] == self.path and scope["method"] in ("GET", "HEAD"):
+            await send({"type": "http.response.start", "status": 200, "headers": self.headers})
+            body = b"" if scope["method"] == "HEAD" else self.body
+            await send({"type": "http.response.body", "body": body})
+            return
+        await self.app(scope, receive, send)
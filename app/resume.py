@@ -1,18 +1,56 @@
-import io
-import json
 import logging
 import asyncio
+import copy
+import hashlib
+import os
 import time
-from concurrent.futures import ThreadPoolExecutor
-from typing import Optional
-from pypdf import PdfReader
-from openai import AsyncOpenAI
-from .config import get_settings
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Optional, Tuple
+import orjson
+import pypdfium2 as pdfium
+from .cache import TTLCache
+from .clients import get_openai_client
 
 logger = logging.getLogger(__name__)
 
-# Create a thread pool executor for CPU-bound tasks
-_executor = ThreadPoolExecutor(max_workers=2)
+
+def _init_worker() -> None:
+    """
+    Reset logging in a PDF worker process. A forked worker inherits the parent's
+    QueueHandler, but the listener thread draining that queue only runs in the
+    parent, so records logged in the worker would be silently dropped.
+    """
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+    logging.root.handlers = [handler]
+
+
+# PDF parsing is CPU-bound (PDFium, which is also not thread-safe); run it in worker
+# processes so it neither holds the GIL nor stalls the event loop serving live interviews.
+# Every uvicorn worker gets its own pool, so the cores are shared between them
+# (WEB_CONCURRENCY). The pool is created on the first upload, so importing this
+# module (scripts, workers that never parse a PDF) starts nothing.
+@lru_cache()
+def _get_executor() -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=max(1, (os.cpu_count() or 2) // max(1, int(os.getenv("WEB_CONCURRENCY", "1")))),
+        initializer=_init_worker,
+    )
+
+
+def shutdown_executor() -> None:
+    """Stop the PDF worker processes, if any were started (called on app shutdown)."""
+    if _get_executor.cache_info().currsize:
+        _get_executor().shutdown(wait=True, cancel_futures=True)
+        _get_executor.cache_clear()
+
+# Successful summaries keyed by a hash of the (trimmed) resume text, so
+# re-uploading the same resume skips the OpenAI round trip
+_summary_cache = TTLCache(maxsize=256, ttl=60 * 60)
+
+# Extracted text keyed by a hash of the uploaded PDF bytes, so re-uploads skip parsing
+_pdf_text_cache = TTLCache(maxsize=256, ttl=60 * 60)
 
 RESUME_SUMMARY_PROMPT = (
     "Extract key items from the resume text. "
@@ -32,65 +70,112 @@ RESUME_SUMMARY_PROMPT = (
 )
 
 
-def _extract_text_from_pdf_sync(file_bytes: bytes, request_id: str = "unknown") -> str:
-    """Synchronous PDF extraction - runs in thread pool."""
-    start_time = time.time()
+# Documents up to _SERIAL_PAGE_LIMIT pages (virtually every resume) are parsed by a
+# single worker task. Every extra task re-sends and re-parses the whole PDF, which
+# only pays off for long documents; their remaining pages are then spread across
+# the pool _PAGES_PER_TASK at a time.
+_SERIAL_PAGE_LIMIT = 8
+_PAGES_PER_TASK = 4
+
+
+def _extract_pages_sync(
+    file_bytes: bytes, start: int, stop: int, request_id: str = "unknown"
+) -> Tuple[int, List[str]]:
+    """
+    Extract text from pages [start, stop) - runs in a worker process (must stay
+    top-level to be picklable). Each task opens its own reader from the raw bytes.
+    Returns the document's total page count and the extracted page texts.
+    """
+    start_time = time.perf_counter()
     
+    pdf = None
     try:
-        elapsed = time.time() - start_time
-        logger.info(f"[{request_id}] [{elapsed:.2f}s] Extracting text from PDF: {len(file_bytes)} bytes")
-        pdf = PdfReader(io.BytesIO(file_bytes))
-        elapsed = time.time() - start_time
-        logger.info(f"[{request_id}] [{elapsed:.2f}s] PDF parsed: {len(pdf.pages)} pages")
+        pdf = pdfium.PdfDocument(file_bytes)
+        page_count = len(pdf)
+        logger.info("[%s] [%.2fs] PDF parsed: %s pages (extracting %s-%s)", request_id, time.perf_counter() - start_time, page_count, start + 1, min(stop, page_count))
         
         pages = []
-        for i, page in enumerate(pdf.pages):
-            page_start = time.time()
+        log_pages = logger.isEnabledFor(logging.DEBUG)
+        for i in range(start, min(stop, page_count)):
+            page = textpage = None
             try:
-                page_text = page.extract_text() or ""
+                page = pdf[i]
+                textpage = page.get_textpage()
+                # PDFium separates lines with \r\n
+                page_text = textpage.get_text_range().replace("\r\n", "\n")
                 pages.append(page_text)
-                page_elapsed = time.time() - page_start
-                logger.debug(f"[{request_id}] [{page_elapsed:.2f}s] Extracted {len(page_text)} characters from page {i+1}")
+                if log_pages:
+                    logger.debug("[%s] [%.2fs] Extracted %s characters from page %s", request_id, time.perf_counter() - start_time, len(page_text), i + 1)
             except Exception as e:
-                page_elapsed = time.time() - page_start
-                logger.warning(f"[{request_id}] [{page_elapsed:.2f}s] Error extracting text from page {i+1}: {str(e)}")
+                logger.warning("[%s] [%.2fs] Error extracting text from page %s: %s", request_id, time.perf_counter() - start_time, i + 1, e)
                 pages.append("")
-        
-        text = "\n".join(pages)
-        elapsed = time.time() - start_time
-        logger.info(f"[{request_id}] [{elapsed:.2f}s] Total extracted text length: {len(text)} characters")
-        return text
+            finally:
+                # Free native PDFium handles promptly rather than at garbage collection
+                if textpage is not None:
+                    textpage.close()
+                if page is not None:
+                    page.close()
+        return page_count, pages
     except Exception as e:
-        elapsed = time.time() - start_time
-        logger.error(f"[{request_id}] [{elapsed:.2f}s] Failed to extract text from PDF: {str(e)}", exc_info=True)
+        logger.error("[%s] [%.2fs] Failed to extract text from PDF: %s", request_id, time.perf_counter() - start_time, e, exc_info=True)
         raise ValueError(f"PDF extraction failed: {str(e)}")
+    finally:
+        if pdf is not None:
+            pdf.close()
 
 
 async def extract_text_from_pdf(file_bytes: bytes, request_id: str = "unknown") -> str:
-    """Extract text from PDF file bytes (async wrapper)."""
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(_executor, _extract_text_from_pdf_sync, file_bytes, request_id)
+    """
+    Extract text from PDF file bytes (async wrapper).
+    The first task extracts up to _SERIAL_PAGE_LIMIT pages and reports the page
+    count; only pages beyond that are extracted in parallel across the worker processes.
+    """
+    start_time = time.perf_counter()
+    cache_key = hashlib.blake2b(file_bytes, digest_size=16).digest()
+    cached = _pdf_text_cache.get(cache_key)
+    if cached is not None:
+        logger.info("[%s] PDF text cache hit: %s bytes", request_id, len(file_bytes))
+        return cached
+    logger.info("[%s] Extracting text from PDF: %s bytes", request_id, len(file_bytes))
+    loop = asyncio.get_running_loop()
+    executor = _get_executor()
+    page_count, pages = await loop.run_in_executor(
+        executor, _extract_pages_sync, file_bytes, 0, _SERIAL_PAGE_LIMIT, request_id
+    )
+    if page_count > _SERIAL_PAGE_LIMIT:
+        rest = await asyncio.gather(*(
+            loop.run_in_executor(executor, _extract_pages_sync, file_bytes, first, first + _PAGES_PER_TASK, request_id)
+            for first in range(_SERIAL_PAGE_LIMIT, page_count, _PAGES_PER_TASK)
+        ))
+        for _, chunk in rest:
+            pages.extend(chunk)
+    
+    text = "\n".join(pages)
+    _pdf_text_cache.set(cache_key, text)
+    logger.info("[%s] [%.2fs] Total extracted text length: %s characters from %s pages", request_id, time.perf_counter() - start_time, len(text), page_count)
+    return text
 
 
 async def summarize_resume(text: str, request_id: str = "unknown") -> dict:
     """Summarize resume text using OpenAI API."""
-    start_time = time.time()
+    start_time = time.perf_counter()
     
-    settings = get_settings()
-    # Increase timeout to 60 seconds to match frontend and handle slower API responses
-    client = AsyncOpenAI(api_key=settings.openai_api_key, timeout=60.0)
+    # Shared client (pooled connections); 60s timeout to match frontend and handle slower API responses
+    client = get_openai_client().with_options(timeout=60.0)
     
     try:
         # Clip overly long resumes
         trimmed = text[:12000]
-        elapsed = time.time() - start_time
-        logger.info(f"[{request_id}] [{elapsed:.2f}s] Summarizing resume: {len(text)} chars (trimmed to {len(trimmed)})")
+        cache_key = hashlib.blake2b(trimmed.encode("utf-8"), digest_size=16).digest()
+        cached = _summary_cache.get(cache_key)
+        if cached is not None:
+            logger.info("[%s] Resume summary cache hit", request_id)
+            return copy.deepcopy(cached)
+        api_start = time.perf_counter()
+        logger.info("[%s] [%.2fs] Summarizing resume: %s chars (trimmed to %s)", request_id, api_start - start_time, len(text), len(trimmed))
         
         # Wrap the API call in asyncio timeout as additional safety
-        api_start = time.time()
         try:
-            elapsed = time.time() - start_time
-            logger.info(f"[{request_id}] [{elapsed:.2f}s] Making OpenAI API call...")
             resp = await asyncio.wait_for(
                 client.chat.completions.create(
                     model="gpt-4o-mini",
@@ -103,31 +188,23 @@ async def summarize_resume(text: str, request_id: str = "unknown") -> dict:
                 ),
                 timeout=65.0  # Slightly longer than client timeout
             )
-            api_elapsed = time.time() - api_start
-            elapsed = time.time() - start_time
-            logger.info(f"[{request_id}] [{elapsed:.2f}s] OpenAI API call completed (API took {api_elapsed:.2f}s)")
+            now = time.perf_counter()
+            logger.info("[%s] [%.2fs] OpenAI API call completed (API took %.2fs)", request_id, now - start_time, now - api_start)
         except asyncio.TimeoutError:
-            api_elapsed = time.time() - api_start
-            elapsed = time.time() - start_time
-            logger.error(f"[{request_id}] [{elapsed:.2f}s] OpenAI API call timed out after {api_elapsed:.2f}s (65s limit)")
+            now = time.perf_counter()
+            logger.error("[%s] [%.2fs] OpenAI API call timed out after %.2fs (65s limit)", request_id, now - start_time, now - api_start)
             raise ValueError("Resume summarization timed out. Please try again.")
         
-        elapsed = time.time() - start_time
         content = resp.choices[0].message.content or "{}"
-        logger.info(f"[{request_id}] [{elapsed:.2f}s] Received response from OpenAI: {len(content)} characters")
         
-        parse_start = time.time()
         try:
-            summary = json.loads(content)
-            parse_elapsed = time.time() - parse_start
-            elapsed = time.time() - start_time
-            logger.info(f"[{request_id}] [{elapsed:.2f}s] Successfully parsed resume summary with keys: {list(summary.keys())} (parsing took {parse_elapsed:.2f}s)")
+            summary = orjson.loads(content)
+            logger.info("[%s] [%.2fs] Parsed resume summary (%s characters) with keys: %s", request_id, time.perf_counter() - start_time, len(content), list(summary))
+            _summary_cache.set(cache_key, copy.deepcopy(summary))
             return summary
-        except json.JSONDecodeError as e:
-            parse_elapsed = time.time() - parse_start
-            elapsed = time.time() - start_time
-            logger.error(f"[{request_id}] [{elapsed:.2f}s] Failed to parse JSON response: {str(e)} (parsing took {parse_elapsed:.2f}s)")
-            logger.error(f"[{request_id}] Response content: {content[:500]}")
+        except orjson.JSONDecodeError as e:
+            logger.error("[%s] [%.2fs] Failed to parse JSON response: %s", request_id, time.perf_counter() - start_time, e)
+            logger.error("[%s] Response content: %.500s", request_id, content)
             # Return a default structure if JSON parsing fails
             return {
                 "name": "",
@@ -143,12 +220,12 @@ async def summarize_resume(text: str, request_id: str = "unknown") -> dict:
                 "claims": []
             }
     except Exception as e:
-        elapsed = time.time() - start_time
-        logger.error(f"[{request_id}] [{elapsed:.2f}s] Failed to summarize resume: {str(e)}", exc_info=True)
+        elapsed = time.perf_counter() - start_time
+        logger.error("[%s] [%.2fs] Failed to summarize resume: %s", request_id, elapsed, e, exc_info=True)
         # Check if it's a timeout error
         error_str = str(e).lower()
         if "timeout" in error_str or "timed out" in error_str:
-            logger.error(f"[{request_id}] [{elapsed:.2f}s] OpenAI API timeout - this may indicate network issues or API slowness")
+            logger.error("[%s] [%.2fs] OpenAI API timeout - this may indicate network issues or API slowness", request_id, elapsed)
             raise ValueError("Resume summarization timed out. Please try again.")
         raise
 
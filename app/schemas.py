@@ -1,6 +1,6 @@
-from typing import List, Optional
-from datetime import datetime
-from pydantic import BaseModel
+from dataclasses import dataclass, field
+from typing import FrozenSet, List, Optional, Pattern
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ResumeContext(BaseModel):
@@ -9,15 +9,15 @@ class ResumeContext(BaseModel):
     """
     name: Optional[str] = None
     summary: Optional[str] = None
-    roles: List[str] = []
-    skills: List[str] = []
-    tools: List[str] = []
-    projects: List[str] = []
-    education: List[str] = []
-    certifications: List[str] = []
-    achievements: List[str] = []
+    roles: List[str] = Field(default_factory=list)
+    skills: List[str] = Field(default_factory=list)
+    tools: List[str] = Field(default_factory=list)
+    projects: List[str] = Field(default_factory=list)
+    education: List[str] = Field(default_factory=list)
+    certifications: List[str] = Field(default_factory=list)
+    achievements: List[str] = Field(default_factory=list)
     experience_years: Optional[float] = None
-    claims: List[str] = []
+    claims: List[str] = Field(default_factory=list)
 
 
 class StartPayload(BaseModel):
@@ -43,14 +43,31 @@ class QaItem(BaseModel):
     """
     Single question/answer pair for the final JSON payload.
     """
+    # Report-shape models are rarely built, so their validators are compiled on first use
+    model_config = ConfigDict(defer_build=True)
     q: str
     a: str
 
 
+@dataclass(slots=True)
+class Turn:
+    """
+    One answered question in the session history.
+    Slotted dataclass rather than a dict: smaller per turn, and fields are
+    read through slot descriptors instead of string-key hashing.
+    """
+    q: str
+    a: str
+    score: int
+    type: str
+    q_shingles: FrozenSet[str] = frozenset()  # Cached for the repetition check so past questions are shingled only once
+
+
 class EvaluationScores(BaseModel):
     """
     Final evaluation scores for the simplified JSON schema.
     """
+    model_config = ConfigDict(defer_build=True)
     communication: int
     technical: int
     problem_solving: int
@@ -62,9 +79,10 @@ class FinalEvaluation(BaseModel):
     """
     Top-level evaluation object returned at the end of the interview.
     """
+    model_config = ConfigDict(defer_build=True)
     status: str  # "completed" | "canceled"
     resume_summary: Optional[str] = None
-    questions: List[QaItem] = []
+    questions: List[QaItem] = Field(default_factory=list)
     evaluation: EvaluationScores
 
 
@@ -75,26 +93,39 @@ class LlmResult(BaseModel):
     next_question: str
     answer_score: int
     rationale: str
-    red_flags: List[str] = []
+    red_flags: List[str] = Field(default_factory=list)
     end_interview: bool = False
-    # Optional fields for when the LLM decides to end the interview.
-    final_summary: Optional[str] = None
-    final_json: Optional[dict] = None  # Expected to conform to FinalEvaluation
     # Flow control metadata
     question_type: Optional[str] = None  # "intro", "technical", "behavioral", "followup"
 
 
-class SessionState(BaseModel):
+@dataclass(slots=True)
+class SessionState:
     """
     Server-side state for a single interview session.
+    Internal only (never validated from client input), so a slotted dataclass:
+    field writes on the turn loop are plain slot stores.
     """
     role: str
     level: str
     candidate_name: Optional[str] = None
     resume_context: Optional[ResumeContext] = None
-    # Turn-level history: list of dicts with keys q, a, score, type
-    history: list = []
+    # Turn-level history, oldest first
+    history: List[Turn] = field(default_factory=list)
+    # Rolling summary of turns that have left the LLM prompt window
+    history_summary: str = ""
+    history_summarized_turns: int = 0  # Number of leading history turns covered by history_summary
+    asked_questions: set = field(default_factory=set)  # Lowercased, whitespace-normalised questions for O(1) exact-repeat checks
     question_count: int = 0
+    # Running score aggregates, updated as each turn is appended so the end check,
+    # prompt context and final evaluation never rescan history
+    score_sum: float = 0
+    score_count: int = 0
+    high_score_count: int = 0  # Turns scored >= 4
+    low_score_count: int = 0  # Turns scored <= 2
+    answer_chars: int = 0  # Total transcript characters across turns
+    type_score_sum: dict = field(default_factory=dict)  # question_type -> summed score
+    type_count: dict = field(default_factory=dict)  # question_type -> number of turns
     has_asked_intro: bool = False
     has_asked_behavioral: bool = False
     # Simple counters for clarification / struggle tracking (used by flow logic)
@@ -107,13 +138,15 @@ class SessionState(BaseModel):
     clarification_depth: int = 0  # Track consecutive clarifications on same topic
     last_clarification_topic: Optional[str] = None  # Track what we're clarifying
     # Topic coverage tracking: prevent getting stuck on single topic
-    covered_topics: List[str] = []  # List of resume topics (skills, projects, roles, tools) that have been discussed
-    covered_dimensions: dict = {}  # Track which interview dimensions have been covered
+    covered_topics: List[str] = field(default_factory=list)  # List of resume topics (skills, projects, roles, tools) that have been discussed
+    covered_dimensions: dict = field(default_factory=dict)  # Track which interview dimensions have been covered
+    # Resume topics (skills, projects, roles, tools) not yet in covered_topics, built once at
+    # session start; entries are removed as they are matched, so per-turn matching shrinks
+    uncovered_topics: dict = field(default_factory=dict)  # topic.lower() -> (topic, is_project)
+    topic_pattern: Optional[Pattern] = None  # Compiled alternation over uncovered_topics keys
     max_questions_per_topic: int = 4  # Configurable limit (3-4 questions per topic)
     # Timestamps / flags
     interview_started_at: Optional[str] = None
-    interview_start_time: Optional[float] = None  # Unix timestamp for duration tracking
+    resume_summary: Optional[str] = None  # resume_context.summary, captured at session start
+    interview_start_time: Optional[float] = None  # time.monotonic() at session start, for duration tracking
     consent_given: bool = False
-
-
-
@@ -2,12 +2,69 @@ import asyncio
 import base64
 import io
 import logging
-from typing import Optional, Tuple
-from openai import AsyncOpenAI
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional
+from .clients import get_openai_client
 from .config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Local faster-whisper model (only used when WHISPER_LOCAL_MODEL is set).
+# Loaded once on first use; inference runs off the event loop.
+_local_model = None
+_local_model_lock = threading.Lock()
+
+
+@lru_cache()
+def _local_executor() -> ThreadPoolExecutor:
+    """Threads for local inference, created on first use so API-only deployments never start them."""
+    return ThreadPoolExecutor(max_workers=2)
+
+
+# Static part of the Whisper prompt; only the current question is appended per call
+WHISPER_BASE_PROMPT = (
+    "This is a job interview. The candidate is answering questions from an AI interviewer. "
+    "Common phrases include: yes, yes we can start, yes I'm ready, no, I can, I have experience, "
+    "I worked on, we can start, let me explain, for example, I would, I did, we implemented, "
+    "I used, I developed, I was responsible for, I helped, I created, I built, I designed."
+)
+
+
+def _get_local_model():
+    """Load the configured faster-whisper model once (thread-safe)."""
+    global _local_model
+    with _local_model_lock:
+        if _local_model is None:
+            from faster_whisper import WhisperModel  # Optional dependency
+
+            settings = get_settings()
+            logger.info(
+                "Loading local Whisper model '%s' (compute_type=%s)",
+                settings.whisper_local_model,
+                settings.whisper_compute_type,
+            )
+            _local_model = WhisperModel(
+                settings.whisper_local_model,
+                device="auto",
+                compute_type=settings.whisper_compute_type,
+            )
+    return _local_model
+
+
+def _transcribe_local_sync(audio_bytes: bytes, prompt: str) -> str:
+    """Synchronous local transcription - runs in the executor."""
+    model = _get_local_model()
+    segments, _ = model.transcribe(
+        io.BytesIO(audio_bytes),
+        language="en",
+        beam_size=1,
+        initial_prompt=prompt,
+    )
+    return " ".join(segment.text.strip() for segment in segments)
+
 
 async def transcribe_base64_audio(
     audio_base64: str, 
@@ -15,96 +72,70 @@ async def transcribe_base64_audio(
     current_question: Optional[str] = None
 ) -> Optional[str]:
     """
-    Transcribe a base64-encoded audio payload using OpenAI Whisper API.
+    Transcribe a base64-encoded audio payload.
+    Decodes once and delegates to transcribe_audio.
+    """
+    return await transcribe_audio(base64.b64decode(audio_base64), mime_type, current_question)
+
+
+async def transcribe_audio(
+    audio_bytes: bytes,
+    mime_type: str = "audio/wav",
+    current_question: Optional[str] = None
+) -> Optional[str]:
+    """
+    Transcribe raw audio bytes using OpenAI Whisper API (or the local model).
     Returns the text transcript or None on failure.
     
     OPTIMIZED: Added timeout and timing logs for latency tracking.
     """
-    import time
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     settings = get_settings()
-    client = AsyncOpenAI(api_key=settings.openai_api_key, timeout=30.0)  # OPTIMIZATION: Add timeout
-    audio_bytes = base64.b64decode(audio_base64)
     
     # OPTIMIZATION: Log audio size for optimization tracking
     audio_size_mb = len(audio_bytes) / (1024 * 1024)
     if audio_size_mb > 2.0:
-        logger.warning(f"Large audio file: {audio_size_mb:.2f}MB - may take longer to transcribe")
+        logger.warning("Large audio file: %.2fMB - may take longer to transcribe", audio_size_mb)
     
     # Validate audio size (should be at least a few KB for real speech)
     if len(audio_bytes) < 1000:  # Less than 1KB is suspicious
-        logger.warning(f"Audio too small: {len(audio_bytes)} bytes - likely invalid")
+        logger.warning("Audio too small: %s bytes - likely invalid", len(audio_bytes))
         return None
     
-    file_like = io.BytesIO(audio_bytes)
-    file_like.name = f"audio.{mime_type.split('/')[-1]}"
-    
-    # Build dynamic prompt based on context
-    prompt_parts = [
-        "This is a job interview. The candidate is answering questions from an AI interviewer.",
-        "Common phrases include: yes, yes we can start, yes I'm ready, no, I can, I have experience,",
-        "I worked on, we can start, let me explain, for example, I would, I did, we implemented,",
-        "I used, I developed, I was responsible for, I helped, I created, I built, I designed."
-    ]
+    # Raw bytes go straight into the multipart upload - no BytesIO wrapper needed
+    upload = (f"audio.{mime_type.split('/')[-1]}", audio_bytes, mime_type)
     
     if current_question:
         # Add the specific question context to help Whisper understand what's being answered
-        prompt_parts.append(f"The candidate is responding to this question: {current_question}")
-    
-    prompt = " ".join(prompt_parts)
+        prompt = f"{WHISPER_BASE_PROMPT} The candidate is responding to this question: {current_question}"
+    else:
+        prompt = WHISPER_BASE_PROMPT
     
     try:
-        logger.info(f"Transcribing audio: {len(audio_bytes)} bytes ({audio_size_mb:.2f}MB), format: {mime_type}")
-        if current_question:
-            logger.info(f"Using question context: {current_question[:100]}...")
-        
-        api_start = time.time()
-        result = await client.audio.transcriptions.create(
-            file=file_like,
-            model="whisper-1",
-            language="en",
-            response_format="json",
-            prompt=prompt
-        )
-        api_time = time.time() - api_start
-        
-        transcript = result.text.strip()
-        total_time = time.time() - start_time
+        logger.info("Transcribing audio: %s bytes (%.2fMB), format: %s", len(audio_bytes), audio_size_mb, mime_type)
+        if current_question and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Using question context: %.100s...", current_question)
         
-        logger.info(f"=== TRANSCRIPTION SUCCESSFUL ===")
-        logger.info(f"Full transcript: '{transcript}'")
-        logger.info(f"Transcript length: {len(transcript)} characters")
-        logger.info(f"Transcription time: {total_time:.2f}s (API: {api_time:.2f}s)")
-        if current_question:
-            logger.info(f"Question context was: '{current_question[:100]}...'")
-        logger.info(f"=================================")
+        api_start = time.perf_counter()
+        if settings.whisper_local_model:
+            loop = asyncio.get_running_loop()
+            text = await loop.run_in_executor(_local_executor(), _transcribe_local_sync, audio_bytes, prompt)
+        else:
+            # Shared client: reuses pooled keep-alive connections to the API
+            client = get_openai_client().with_options(timeout=30.0)
+            result = await client.audio.transcriptions.create(
+                file=upload,
+                model="whisper-1",
+                language="en",
+                response_format="text",  # Plain string body - no JSON envelope to parse
+                prompt=prompt
+            )
+            text = result if isinstance(result, str) else result.text
+        transcript = text.strip()
+        end = time.perf_counter()
+        logger.info("Transcription successful: %s characters in %.2fs (API: %.2fs)", len(transcript), end - start_time, end - api_start)
         return transcript if transcript else None
     except Exception as e:
-        elapsed = time.time() - start_time
-        logger.error(f"Transcription failed after {elapsed:.2f}s: {str(e)}", exc_info=True)
+        logger.error("Transcription failed after %.2fs: %s", time.perf_counter() - start_time, e, exc_info=True)
         return None
-
-
-async def transcribe_with_early_reasoning(
-    audio_base64: str,
-    mime_type: str,
-    current_question: Optional[str],
-    state,
-    prepared_context: dict,
-    call_llm_func
-) -> Tuple[Optional[str], Optional[any]]:
-    """
-    Simplified transcription - removed incremental approach that was adding latency.
-    Now just uses single transcription call for better performance and accuracy.
-    
-    Returns: (transcript, None) - no early reasoning to avoid latency overhead
-    """
-    # SIMPLIFIED: Just use single transcription call - it's faster and more accurate
-    # The incremental approach was actually slower (2 API calls) and caused quality issues
-    try:
-        transcript = await transcribe_base64_audio(audio_base64, mime_type, current_question)
-        return transcript, None  # No early reasoning - it adds latency without benefit
-    except Exception as e:
-        logger.error(f"Transcription failed: {str(e)}", exc_info=True)
-        return None, None
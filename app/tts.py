@@ -1,49 +1,169 @@
 import asyncio
+import hashlib
 import logging
+from collections import OrderedDict
+from functools import lru_cache
+from typing import AsyncGenerator, AsyncIterator, Optional, Tuple
 import httpx
 from .config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Shared client: every question (and every interview) reuses pooled keep-alive
+# connections to ElevenLabs instead of paying a new TLS handshake per request.
+# HTTP/2 lets concurrent interviews multiplex streams over the same connection.
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=30,
+            # Candidates answer for tens of seconds between utterances; httpx's default
+            # 5s keep-alive expiry would drop the connection before the next question
+            limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60),
+        )
+    return _client
+
+
+@lru_cache()
+def _tts_semaphore() -> asyncio.Semaphore:
+    """Caps concurrent ElevenLabs streams in this worker (TTS_MAX_CONCURRENCY)."""
+    return asyncio.Semaphore(get_settings().tts_max_concurrency)
+
+
+@lru_cache()
+def _request_target() -> Tuple[str, dict, dict]:
+    """Stream URL, headers and voice settings - fixed by configuration, built once."""
+    settings = get_settings()
+    url = f"https://api.elevenlabs.io/v1/text-to-speech/{settings.eleven_voice_id}/stream"
+    headers = {
+        "xi-api-key": settings.eleven_api_key,
+        "Accept": "audio/mpeg",
+        "Content-Type": "application/json",
+    }
+    voice_settings = {
+        "stability": settings.tts_stability,
+        "similarity_boost": settings.tts_similarity_boost,
+    }
+    return url, headers, voice_settings
+
+
+async def close_client() -> None:
+    """Close the shared ElevenLabs client (called on app shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 class TTSException(Exception):
     """Custom exception for TTS errors."""
     pass
 
 
+# Audio for fixed phrases (e.g. the intro question), rendered once at startup and
+# served from memory to every interview instead of a fresh ElevenLabs request
+_phrase_audio: dict = {}
+
+# Short utterances that recur verbatim across interviews ("Can you tell me more about
+# your experience?", clarifications, fallbacks) are kept as complete MP3 bytes in a
+# byte-bounded LRU. Voice and model settings are fixed per process, so the text is the key.
+# Most utterances (LLM questions, greetings with the candidate's name) are said once,
+# so a text is only admitted on its second request; first requests just leave a
+# short digest in a count-bounded LRU.
+TTS_CACHE_MAX_TEXT_CHARS = 300
+TTS_CACHE_SEEN_MAX = 4096
+TTS_CACHE_CHUNK_BYTES = 8192  # Slice size when replaying cached audio
+_audio_seen: "OrderedDict[bytes, None]" = OrderedDict()
+TTS_CACHE_MAX_BYTES = 50 * 1024 * 1024
+_audio_cache: "OrderedDict[str, bytes]" = OrderedDict()
+_audio_cache_bytes = 0
+
+
+def _cache_audio(text: str, audio: bytes) -> None:
+    """Store a fully streamed utterance, evicting least recently used entries past the byte cap."""
+    global _audio_cache_bytes
+    if text in _audio_cache or len(audio) > TTS_CACHE_MAX_BYTES:
+        return
+    _audio_cache[text] = audio
+    _audio_cache_bytes += len(audio)
+    while _audio_cache_bytes > TTS_CACHE_MAX_BYTES:
+        _, evicted = _audio_cache.popitem(last=False)
+        _audio_cache_bytes -= len(evicted)
+
+
+def _seen_before(text: str) -> bool:
+    """Record a request for `text`; True if it was already requested recently."""
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+    if digest in _audio_seen:
+        _audio_seen.move_to_end(digest)
+        return True
+    _audio_seen[digest] = None
+    if len(_audio_seen) > TTS_CACHE_SEEN_MAX:
+        _audio_seen.popitem(last=False)
+    return False
+
+
+async def precompute_phrase(text: str) -> None:
+    """
+    Render `text` once and keep the audio, so later stream_eleven(text) calls
+    skip the API. Failures are logged and the phrase is simply streamed live.
+    """
+    try:
+        audio = b"".join([chunk async for chunk in stream_eleven(text)])
+    except TTSException as e:
+        logger.warning("Could not precompute TTS audio (%d characters): %s", len(text), e)
+        return
+    _phrase_audio[text] = audio
+    logger.info("Precomputed TTS audio: %d characters -> %d bytes", len(text), len(audio))
+
+
 async def stream_eleven(text: str):
     """
     Stream ElevenLabs TTS audio chunks for the given text.
     Yields raw audio bytes suitable for WebSocket binary frames.
     """
+    audio = _phrase_audio.get(text)
+    if audio is None:
+        audio = _audio_cache.get(text)
+        if audio is not None:
+            _audio_cache.move_to_end(text)
+    if audio is not None:
+        # Replay in fixed-size slices, like a live stream, yielding to the loop between them
+        for start in range(0, len(audio), TTS_CACHE_CHUNK_BYTES):
+            yield audio[start:start + TTS_CACHE_CHUNK_BYTES]
+            await asyncio.sleep(0)
+        return
+
     settings = get_settings()
     
     # Do not log API key information - security best practice
     logger.info(f"TTS Request - Voice ID: {settings.eleven_voice_id}")
     
-    url = f"https://api.elevenlabs.io/v1/text-to-speech/{settings.eleven_voice_id}/stream"
-    headers = {
-        "xi-api-key": settings.eleven_api_key,
-        "Accept": "audio/mpeg",
-        "Content-Type": "application/json",
-    }
+    url, headers, voice_settings = _request_target()
     payload = {
         "text": text,
         "model_id": "eleven_turbo_v2",
-        "voice_settings": {
-            "stability": settings.tts_stability,
-            "similarity_boost": settings.tts_similarity_boost,
-        },
+        "voice_settings": voice_settings,
         "optimize_streaming_latency": settings.tts_streaming_latency,
     }
+    # Concurrent first requests for the same text each stream live rather than
+    # waiting on one another; whichever finishes first fills the cache
+    captured = [] if len(text) <= TTS_CACHE_MAX_TEXT_CHARS and _seen_before(text) else None
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            async with client.stream("POST", url, headers=headers, json=payload) as resp:
-                resp.raise_for_status()
-                async for chunk in resp.aiter_bytes():
-                    if chunk:
-                        yield chunk
-                    await asyncio.sleep(0)  # cooperative scheduling
+        async with _tts_semaphore(), _get_client().stream("POST", url, headers=headers, json=payload) as resp:
+            resp.raise_for_status()
+            async for chunk in resp.aiter_bytes():
+                if chunk:
+                    if captured is not None:
+                        captured.append(chunk)
+                    yield chunk
+        # Only complete streams are cached - an abandoned or failed one never gets here
+        if captured:
+            _cache_audio(text, b"".join(captured))
     except httpx.HTTPStatusError as e:
         # For streaming responses, we need to read the response before accessing .text
         error_message = f"ElevenLabs API error: {e.response.status_code}"
@@ -74,3 +194,71 @@ async def stream_eleven(text: str):
         raise TTSException(f"Network error calling ElevenLabs: {str(e)}")
     except Exception as e:
         raise TTSException(f"Unexpected TTS error: {str(e)}")
+
+
+async def coalesce(
+    chunks: AsyncGenerator[bytes, None],
+    min_bytes: int = 16384,
+    max_wait_ms: int = 50,
+    max_pending: int = 8,
+) -> AsyncIterator[bytes]:
+    """
+    Merge small audio chunks into larger WebSocket frames.
+    A buffer is flushed once it holds `min_bytes`, or `max_wait_ms` after its
+    first byte arrived, so audio is never held back noticeably.
+    The source is read by its own task into a queue of up to `max_pending`
+    chunks, so upstream reads overlap with downstream sends and only pause
+    when the consumer genuinely falls behind.
+    Errors raised by the source stream are re-raised to the caller.
+    When the consumer stops early, the reader task is cancelled and the source
+    is closed straight away, releasing its HTTP stream and TTS semaphore slot.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+    done = object()
+
+    async def pump():
+        # No put in a finally: after cancellation a blocking put on a full
+        # queue would never return, leaving the task (and the source) pending
+        try:
+            async for chunk in chunks:
+                await queue.put(chunk)
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(done)
+
+    loop = asyncio.get_running_loop()
+    pump_task = asyncio.create_task(pump())
+    buf = bytearray()
+    deadline = None
+    try:
+        while True:
+            try:
+                item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                timeout = None if deadline is None else max(0.0, deadline - loop.time())
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    # Nothing more arrived in time - flush what we have
+                    yield bytes(buf)
+                    buf.clear()
+                    deadline = None
+                    continue
+            if item is done:
+                break
+            if isinstance(item, Exception):
+                raise item
+            buf.extend(item)
+            if deadline is None:
+                deadline = loop.time() + max_wait_ms / 1000
+            if len(buf) >= min_bytes:
+                yield bytes(buf)
+                buf.clear()
+                deadline = None
+        if buf:
+            yield bytes(buf)
+    finally:
+        pump_task.cancel()
+        await asyncio.wait([pump_task])
+        await chunks.aclose()
@@ -652,6 +652,12 @@ function startCountdownAndListening() {
 }
 
 function handleJson(msg) {
+    // Several messages sent together in one frame - dispatch them in order
+    if (msg.type === "batch") {
+        msg.messages.forEach(handleJson);
+        return;
+    }
+    
     // Handle resume_summary early to prevent "Unknown message" warning
     // Don't add to transcript - this is internal context only
     if (msg.type === "resume_summary") {
@@ -1082,7 +1088,7 @@ function stopAudioProcessing() {
     }
 }
 
-function float32ToWavBase64(buffers, sampleRate = 44100) {
+function float32ToWav(buffers, sampleRate = 44100) {
   const length = buffers.reduce((acc, b) => acc + b.length, 0);
   const pcm16 = new Int16Array(length);
   let offset = 0;
@@ -1116,18 +1122,18 @@ function float32ToWavBase64(buffers, sampleRate = 44100) {
   const wavBytes = new Uint8Array(buffer);
   wavBytes.set(new Uint8Array(pcm16.buffer), 44);
     
-    // Convert to base64 in chunks to avoid stack overflow
-    // Use a simple loop approach that's safe for large arrays
-    const chunkSize = 8192;
-    let binaryString = "";
-    for (let i = 0; i < wavBytes.length; i += chunkSize) {
-        const chunk = wavBytes.slice(i, Math.min(i + chunkSize, wavBytes.length));
-        // Build string character by character to avoid stack overflow
-        for (let j = 0; j < chunk.length; j++) {
-            binaryString += String.fromCharCode(chunk[j]);
-        }
-    }
-    return btoa(binaryString);
+  return wavBytes;
+}
+
+// Binary answer frame: [4-byte big-endian header length][JSON header][audio bytes].
+// Sending raw audio avoids base64 (+33% size) and a JSON parse of the payload.
+function packAnswerFrame(audioBytes, mimeType) {
+  const header = new TextEncoder().encode(JSON.stringify({ type: "answer", mime_type: mimeType }));
+  const frame = new Uint8Array(4 + header.length + audioBytes.length);
+  new DataView(frame.buffer).setUint32(0, header.length);
+  frame.set(header, 4);
+  frame.set(audioBytes, 4 + header.length);
+  return frame;
 }
 
 function finalizeTurn() {
@@ -1201,17 +1207,11 @@ function finalizeTurn() {
         console.log(`Audio hash (first 100 samples): ${btoa(sampleHash).substring(0, 20)}...`);
     }
     
-    const base64Audio = float32ToWavBase64(turnBuffer, actualSampleRate);
-    console.log(`Base64 audio length: ${base64Audio.length} characters`);
-    console.log(`Base64 audio preview: ${base64Audio.substring(0, 50)}...`);
+    const wavBytes = float32ToWav(turnBuffer, actualSampleRate);
+    console.log(`WAV audio length: ${wavBytes.length} bytes`);
     console.log("===================================");
     
-  ws.send(
-    JSON.stringify({
-      type: "answer",
-      data: { audio_base64: base64Audio, mime_type: "audio/wav" },
-    })
-  );
+  ws.send(packAnswerFrame(wavBytes, "audio/wav"));
     
     // Clear buffer after sending
     turnBuffer = [];